@@ -18,22 +18,16 @@ import json
 import sys
 from pathlib import Path
 
-from datalex_core.datalex import load_project
-from datalex_core.datalex.diff import diff_entities
-from datalex_core.datalex.errors import DataLexLoadError
-from datalex_core.datalex.manifest import build_manifest, manifest_summary
-from datalex_core.datalex.migrate_layout import migrate_project
-import datalex_core.dialects  # noqa: F401  — side-effect registers built-in dialects
-from datalex_core.dialects.registry import get_dialect, known_dialects
-from datalex_core.dbt import emit_dbt, import_manifest, write_import_result
-from datalex_core.dbt.readiness import assess_manifest
-from datalex_core.dbt.sync import sync_dbt_project, report_to_json
-from datalex_core.mesh import mesh_issues, mesh_report
-from datalex_core.packages import PackageResolveError, load_imports_for, resolve_imports
+# datalex_core.datalex and friends are imported inside each _cmd_* handler so
+# registering this command group doesn't drag the whole spec-layout engine
+# into every `datalex` invocation.
 
 
 def register_datalex(parent_sub: argparse._SubParsersAction) -> None:
     """Register `datalex datalex <...>` under the given subparsers object."""
+    import datalex_core.dialects  # noqa: F401  — side-effect registers built-in dialects
+    from datalex_core.dialects.registry import known_dialects
+
     datalex = parent_sub.add_parser("datalex", help="DataLex spec-layout tooling")
     dsub = datalex.add_subparsers(dest="datalex_command", required=True)
 
@@ -308,6 +302,8 @@ def register_datalex(parent_sub: argparse._SubParsersAction) -> None:
 
 
 def _cmd_migrate(args: argparse.Namespace) -> int:
+    from datalex_core.datalex.migrate_layout import migrate_project
+
     report = migrate_project(
         args.model,
         output_root=args.output_root,
@@ -336,6 +332,9 @@ def _cmd_migrate(args: argparse.Namespace) -> int:
 
 
 def _cmd_validate(args: argparse.Namespace) -> int:
+    from datalex_core.datalex import load_project
+    from datalex_core.datalex.errors import DataLexLoadError
+
     strict = not args.non_strict
     try:
         project = load_project(args.root, strict=strict)
@@ -382,6 +381,10 @@ def _cmd_validate(args: argparse.Namespace) -> int:
 
 
 def _cmd_mesh_check(args: argparse.Namespace) -> int:
+    from datalex_core.datalex import load_project
+    from datalex_core.datalex.errors import DataLexLoadError
+    from datalex_core.mesh import mesh_issues, mesh_report
+
     try:
         project = load_project(args.root, strict=False)
     except DataLexLoadError as e:
@@ -425,6 +428,11 @@ def _cmd_mesh_check(args: argparse.Namespace) -> int:
 
 
 def _cmd_emit_ddl(args: argparse.Namespace) -> int:
+    import datalex_core.dialects  # noqa: F401  — side-effect registers built-in dialects
+    from datalex_core.datalex import load_project
+    from datalex_core.datalex.errors import DataLexLoadError
+    from datalex_core.dialects.registry import get_dialect, known_dialects
+
     try:
         project = load_project(args.root, strict=True)
     except DataLexLoadError as e:
@@ -463,6 +471,10 @@ def _cmd_emit_ddl(args: argparse.Namespace) -> int:
 
 
 def _cmd_diff(args: argparse.Namespace) -> int:
+    from datalex_core.datalex import load_project
+    from datalex_core.datalex.diff import diff_entities
+    from datalex_core.datalex.errors import DataLexLoadError
+
     try:
         old = load_project(args.old, strict=False)
         new = load_project(args.new, strict=False)
@@ -484,6 +496,9 @@ def _cmd_diff(args: argparse.Namespace) -> int:
 
 
 def _cmd_info(args: argparse.Namespace) -> int:
+    from datalex_core.datalex import load_project
+    from datalex_core.datalex.errors import DataLexLoadError
+
     try:
         project = load_project(args.root, strict=False)
     except DataLexLoadError as e:
@@ -536,6 +551,10 @@ def _cmd_info(args: argparse.Namespace) -> int:
 
 
 def _cmd_manifest_build(args: argparse.Namespace) -> int:
+    from datalex_core.datalex import load_project
+    from datalex_core.datalex.errors import DataLexLoadError
+    from datalex_core.datalex.manifest import build_manifest, manifest_summary
+
     try:
         project = load_project(args.root, strict=False)
     except DataLexLoadError as e:
@@ -569,6 +588,10 @@ def _cmd_manifest_build(args: argparse.Namespace) -> int:
 
 
 def _cmd_dbt_emit(args: argparse.Namespace) -> int:
+    from datalex_core.datalex import load_project
+    from datalex_core.datalex.errors import DataLexLoadError
+    from datalex_core.dbt import emit_dbt
+
     try:
         project = load_project(args.root, strict=True)
     except DataLexLoadError as e:
@@ -602,6 +625,8 @@ def _cmd_dbt_emit(args: argparse.Namespace) -> int:
 
 
 def _cmd_dbt_import(args: argparse.Namespace) -> int:
+    from datalex_core.dbt import import_manifest, write_import_result
+
     # Auto-discover catalog.json sibling to the manifest — `dbt docs generate`
     # writes it to the same `target/` folder and it carries warehouse types
     # even when manifest.data_type is empty.
@@ -629,6 +654,8 @@ def _cmd_dbt_import(args: argparse.Namespace) -> int:
 
 
 def _cmd_dbt_assess(args: argparse.Namespace) -> int:
+    from datalex_core.dbt.readiness import assess_manifest
+
     try:
         report = assess_manifest(args.manifest)
     except (OSError, json.JSONDecodeError) as e:
@@ -669,6 +696,8 @@ def _cmd_dbt_assess(args: argparse.Namespace) -> int:
 
 
 def _cmd_dbt_sync(args: argparse.Namespace) -> int:
+    from datalex_core.dbt.sync import report_to_json, sync_dbt_project
+
     try:
         report = sync_dbt_project(
             dbt_project_dir=args.dbt_project,
@@ -690,6 +719,9 @@ def _cmd_dbt_sync(args: argparse.Namespace) -> int:
 
 
 def _cmd_expand(args: argparse.Namespace) -> int:
+    from datalex_core.datalex import load_project
+    from datalex_core.datalex.errors import DataLexLoadError
+
     try:
         project = load_project(args.root, strict=False)
     except DataLexLoadError as e:
@@ -718,6 +750,8 @@ def _cmd_expand(args: argparse.Namespace) -> int:
 
 
 def _cmd_packages_resolve(args: argparse.Namespace) -> int:
+    from datalex_core.packages import PackageResolveError, resolve_imports
+
     try:
         report = resolve_imports(
             args.root,
@@ -757,6 +791,8 @@ def _cmd_packages_resolve(args: argparse.Namespace) -> int:
 
 
 def _cmd_packages_list(args: argparse.Namespace) -> int:
+    from datalex_core.packages import PackageResolveError, load_imports_for
+
     try:
         resolved = load_imports_for(args.root)
     except PackageResolveError as e:
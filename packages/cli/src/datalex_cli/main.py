@@ -8,79 +8,63 @@ import os
 import subprocess
 import sys
 import time
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 from urllib.parse import urlparse
 
 import yaml
 
+# libyaml C emitter/parser when available — same output as safe_dump/safe_load
+# but several times faster on the large models this CLI round-trips.
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# orjson serializes large canonical payloads several times faster than the
+# stdlib encoder; it's optional, so fall back to json when not installed.
+try:
+    import orjson as _orjson
+
+    def _json_dumps(obj: Any, indent: bool = True) -> str:
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2 if indent else 0).decode()
+
+    def _dump_json_to(path: str, payload: Any) -> None:
+        """Serialize straight into the file, avoiding an intermediate string."""
+        with open(path, "wb") as handle:
+            handle.write(_orjson.dumps(payload, option=_orjson.OPT_INDENT_2))
+            handle.write(b"\n")
+except ImportError:
+    def _json_dumps(obj: Any, indent: bool = True) -> str:
+        return json.dumps(obj, indent=2 if indent else None)
+
+    def _dump_json_to(path: str, payload: Any) -> None:
+        """Serialize straight into the file, avoiding an intermediate string."""
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2)
+            handle.write("\n")
+
+# Only the symbols needed on every code path (validate/lint) are imported
+# eagerly; everything else — SQL DDL, docs, importers, connectors, policy,
+# resolver — is imported inside the command that uses it so `datalex
+# validate` doesn't pay the full dependency graph at startup.
 from datalex_core import (
-    apply_standards_fixes,
-    compile_model,
-    completeness_as_dict,
-    completeness_report,
-    diagnostics_as_json,
-    format_diagnostics,
-    generate_bash_completion,
-    generate_changelog,
-    generate_fish_completion,
-    generate_html_docs,
-    generate_markdown_docs,
-    generate_migration,
-    generate_sql_ddl,
-    generate_zsh_completion,
-    ConnectorConfig,
-    get_connector,
-    import_dbt_schema_yml,
-    import_dbml,
-    import_spark_schema,
-    import_sql_ddl,
-    sync_dbt_schema_yml,
-    list_connectors,
     lint_issues,
-    load_policy_pack,
-    load_policy_pack_with_inheritance,
     load_schema,
     load_yaml_model,
-    merge_policy_packs,
-    merge_models_preserving_docs,
-    policy_issues,
-    project_diff,
-    resolve_model,
-    resolve_project,
-    run_diagnostics,
     schema_issues,
-    semantic_diff,
-    standards_issues,
-    transform_model,
-    write_changelog,
-    write_dbt_scaffold,
-    write_html_docs,
-    write_markdown_docs,
-    write_migration,
 )
 from datalex_core.issues import Issue, has_errors, to_lines
 
-STARTER_MODEL = """model:
-  name: starter_model
-  version: 1.0.0
-  domain: demo
-  owners:
-    - data-team@example.com
-  state: draft
-
-entities:
-  - name: User
-    type: table
-    fields:
-      - name: user_id
-        type: integer
-        primary_key: true
-        nullable: false
-      - name: email
-        type: string
-        nullable: false
-"""
+
+def _read_template(name: str) -> str:
+    """Load a scaffold template bundled under datalex_cli/templates.
+
+    Kept out of module scope so `validate`/`lint` invocations don't pay for
+    multi-kilobyte string literals they never use.
+    """
+    from importlib.resources import files
+
+    return (files("datalex_cli") / "templates" / name).read_text(encoding="utf-8")
 
 
 def _cli_version() -> str:
@@ -98,631 +82,21 @@ def _cli_version() -> str:
     except importlib.metadata.PackageNotFoundError:
         return "unknown"
 
-MULTI_MODEL_SHARED = """model:
-  name: shared_dimensions
-  spec_version: 2
-  version: 1.0.0
-  domain: shared
-  owners:
-    - data-team@example.com
-  state: draft
-  description: Shared dimension entities used across domain models
-
-entities:
-  - name: Customer
-    type: table
-    description: Customer master record
-    schema: shared
-    subject_area: customer_domain
-    fields:
-      - name: customer_id
-        type: integer
-        primary_key: true
-        nullable: false
-      - name: email
-        type: string
-        nullable: false
-        unique: true
-      - name: full_name
-        type: string
-        nullable: false
-      - name: created_at
-        type: timestamp
-        nullable: false
-
-indexes:
-  - name: idx_customer_email
-    entity: Customer
-    fields: [email]
-    unique: true
-"""
-
-MULTI_MODEL_ORDERS = """model:
-  name: orders
-  spec_version: 2
-  version: 1.0.0
-  domain: sales
-  owners:
-    - data-team@example.com
-  state: draft
-  description: Order domain model
-  imports:
-    - model: shared_dimensions
-      alias: shared
-      entities: [Customer]
-
-entities:
-  - name: Order
-    type: table
-    description: Customer orders
-    schema: sales
-    subject_area: order_domain
-    fields:
-      - name: order_id
-        type: integer
-        primary_key: true
-        nullable: false
-      - name: customer_id
-        type: integer
-        nullable: false
-        foreign_key: true
-      - name: total_amount
-        type: decimal(12,2)
-        nullable: false
-      - name: order_date
-        type: timestamp
-        nullable: false
-
-relationships:
-  - name: order_customer
-    from: Order.customer_id
-    to: Customer.customer_id
-    cardinality: many_to_one
-    description: Order belongs to a customer (cross-model)
-"""
-
-END_TO_END_SOURCE = """model:
-  name: source_sales_raw
-  spec_version: 2
-  version: 1.0.0
-  domain: sales
-  owners:
-    - data-platform@example.com
-  state: draft
-  layer: source
-  description: Source layer contract pulled from warehouse raw schemas.
-
-entities:
-  - name: RawCustomers
-    type: table
-    description: Raw customer profile records from CRM.
-    tags: [BRONZE, SOURCE, CUSTOMER]
-    schema: raw
-    subject_area: customer_domain
-    owner: customer-data@example.com
-    grain: [customer_id]
-    sla:
-      freshness: 4h
-      quality_score: 98
-    fields:
-      - name: customer_id
-        type: string
-        primary_key: true
-        nullable: false
-        description: Stable customer identifier from CRM.
-        tags: [IDENTIFIER]
-      - name: email
-        type: string
-        nullable: false
-        description: Customer email from source system.
-        tags: [PII, CONTACT]
-        sensitivity: restricted
-      - name: created_at
-        type: timestamp
-        nullable: false
-        description: Customer creation timestamp from source.
-        tags: [AUDIT]
-
-  - name: RawOrders
-    type: table
-    description: Raw order transactions from commerce platform.
-    tags: [BRONZE, SOURCE, ORDER]
-    schema: raw
-    subject_area: order_domain
-    owner: order-data@example.com
-    grain: [order_id]
-    sla:
-      freshness: 2h
-      quality_score: 97
-    fields:
-      - name: order_id
-        type: string
-        primary_key: true
-        nullable: false
-        description: Unique order identifier.
-        tags: [IDENTIFIER]
-      - name: customer_id
-        type: string
-        nullable: false
-        foreign_key: true
-        description: Customer identifier attached to the order.
-        tags: [JOIN_KEY]
-      - name: order_ts
-        type: timestamp
-        nullable: false
-        description: Order creation timestamp.
-        tags: [EVENT_TIME]
-      - name: gross_amount
-        type: decimal(12,2)
-        nullable: false
-        description: Total order amount before discounts and tax allocations.
-        tags: [AMOUNT, FINANCE]
-      - name: status
-        type: string
-        nullable: false
-        description: Raw order lifecycle status.
-        tags: [STATUS]
-
-relationships:
-  - name: raw_orders_customer
-    from: RawOrders.customer_id
-    to: RawCustomers.customer_id
-    cardinality: many_to_one
-    description: Raw order row belongs to a raw customer row.
-
-governance:
-  classification:
-    RawCustomers.email: PII
-  stewards:
-    customer_domain: customer-data@example.com
-    order_domain: order-data@example.com
-  retention:
-    period: 3y
-    policy: source_contract_baseline
-
-glossary:
-  - term: Raw Zone
-    definition: Ingested source-aligned data before business transformations.
-    owner: data-platform@example.com
-    tags: [INGESTION]
-
-rules:
-  - name: raw_orders_amount_non_negative
-    target: RawOrders.gross_amount
-    expression: "value >= 0"
-    severity: error
-"""
-
-END_TO_END_TRANSFORM = """model:
-  name: commerce_transform
-  spec_version: 2
-  version: 1.0.0
-  domain: sales
-  owners:
-    - analytics-engineering@example.com
-  state: draft
-  layer: transform
-  description: Transform layer business models derived from raw sources.
-  imports:
-    - model: source_sales_raw
-      alias: src
-      path: ../source/source_sales_raw.model.yaml
-
-entities:
-  - name: CustomerDim
-    type: table
-    description: Conformed customer dimension for analytics.
-    tags: [SILVER, DIMENSION, CUSTOMER]
-    schema: analytics
-    subject_area: customer_domain
-    owner: analytics-engineering@example.com
-    grain: [customer_id]
-    sla:
-      freshness: 8h
-      quality_score: 99
-    fields:
-      - name: customer_id
-        type: string
-        primary_key: true
-        nullable: false
-        description: Conformed customer key.
-        tags: [IDENTIFIER]
-      - name: email
-        type: string
-        nullable: false
-        description: Customer email used by lifecycle reporting.
-        tags: [PII, CONTACT]
-        sensitivity: restricted
-      - name: customer_tier
-        type: string
-        nullable: false
-        description: Normalized customer segment derived from source events.
-        tags: [SEGMENT]
-
-  - name: OrderFact
-    type: table
-    description: Atomic order-level fact table for finance and growth analytics.
-    tags: [SILVER, FACT, ORDER]
-    schema: analytics
-    subject_area: order_domain
-    owner: analytics-engineering@example.com
-    grain: [order_id]
-    sla:
-      freshness: 4h
-      quality_score: 99
-    fields:
-      - name: order_id
-        type: string
-        primary_key: true
-        nullable: false
-        description: Unique order key.
-        tags: [IDENTIFIER]
-      - name: customer_id
-        type: string
-        nullable: false
-        foreign_key: true
-        description: Foreign key to customer dimension.
-        tags: [JOIN_KEY]
-      - name: order_date
-        type: date
-        nullable: false
-        description: Business order date used for reporting grain.
-        tags: [REPORTING_DATE]
-      - name: net_revenue
-        type: decimal(12,2)
-        nullable: false
-        description: Revenue after discount normalization.
-        tags: [AMOUNT, FINANCE]
-      - name: order_status
-        type: string
-        nullable: false
-        description: Standardized business order status.
-        tags: [STATUS]
-
-relationships:
-  - name: order_fact_customer_dim
-    from: OrderFact.customer_id
-    to: CustomerDim.customer_id
-    cardinality: many_to_one
-    description: Fact row belongs to one customer.
-
-indexes:
-  - name: idx_order_fact_order_date
-    entity: OrderFact
-    fields: [order_date]
-  - name: idx_order_fact_customer_id
-    entity: OrderFact
-    fields: [customer_id]
-
-governance:
-  classification:
-    CustomerDim.email: PII
-  stewards:
-    customer_domain: analytics-engineering@example.com
-    order_domain: analytics-engineering@example.com
-  retention:
-    period: 5y
-    policy: transformed_contract
-
-glossary:
-  - term: Order Fact
-    definition: One row per order after transformation and standardization.
-    owner: analytics-engineering@example.com
-    related_fields:
-      - OrderFact.order_id
-      - OrderFact.net_revenue
-    tags: [FACT]
-
-rules:
-  - name: order_fact_revenue_non_negative
-    target: OrderFact.net_revenue
-    expression: "value >= 0"
-    severity: error
-"""
-
-END_TO_END_REPORT = """model:
-  name: commerce_reporting
-  spec_version: 2
-  version: 1.0.0
-  domain: sales
-  owners:
-    - bi-team@example.com
-  state: draft
-  layer: report
-  description: Reporting layer metric contracts and dictionary-ready semantic views.
-  imports:
-    - model: commerce_transform
-      alias: tr
-      path: ../transform/commerce_transform.model.yaml
-
-entities:
-  - name: DailyRevenueMetric
-    type: view
-    description: Daily revenue KPI contract used by executive dashboards.
-    tags: [GOLD, METRIC, KPI, REPORTING]
-    schema: reporting
-    subject_area: executive_kpis
-    owner: bi-team@example.com
-    grain: [metric_date]
-    sla:
-      freshness: 24h
-      quality_score: 99
-    fields:
-      - name: metric_date
-        type: date
-        nullable: false
-        description: Daily reporting grain for KPI trend lines.
-        tags: [GRAIN, REPORTING_DATE]
-      - name: gross_revenue
-        type: decimal(12,2)
-        nullable: false
-        computed: true
-        computed_expression: "SUM(OrderFact.net_revenue)"
-        description: Sum of net revenue at daily grain.
-        tags: [METRIC, FINANCE]
-      - name: order_count
-        type: integer
-        nullable: false
-        computed: true
-        computed_expression: "COUNT_DISTINCT(OrderFact.order_id)"
-        description: Distinct order count at daily grain.
-        tags: [METRIC, VOLUME]
-      - name: avg_order_value
-        type: decimal(12,2)
-        nullable: false
-        computed: true
-        computed_expression: "gross_revenue / NULLIF(order_count, 0)"
-        description: Average order value derived from daily metrics.
-        tags: [METRIC, FINANCE]
-
-  - name: CustomerRevenueMetric
-    type: view
-    description: Customer-level revenue KPI contract for retention analysis.
-    tags: [GOLD, METRIC, CUSTOMER]
-    schema: reporting
-    subject_area: customer_kpis
-    owner: bi-team@example.com
-    grain: [customer_id, report_month]
-    sla:
-      freshness: 24h
-      quality_score: 99
-    fields:
-      - name: customer_id
-        type: string
-        nullable: false
-        description: Customer identifier for customer KPI cuts.
-        tags: [DIMENSION, IDENTIFIER]
-      - name: report_month
-        type: date
-        nullable: false
-        description: Monthly reporting period for customer metrics.
-        tags: [GRAIN]
-      - name: customer_revenue
-        type: decimal(12,2)
-        nullable: false
-        computed: true
-        computed_expression: "SUM(OrderFact.net_revenue)"
-        description: Total monthly customer revenue.
-        tags: [METRIC, FINANCE]
-      - name: active_order_count
-        type: integer
-        nullable: false
-        computed: true
-        computed_expression: "COUNT_DISTINCT(OrderFact.order_id)"
-        description: Distinct active orders for the customer period.
-        tags: [METRIC]
-
-indexes:
-  - name: idx_daily_revenue_metric_date
-    entity: DailyRevenueMetric
-    fields: [metric_date]
-  - name: idx_customer_revenue_metric_customer
-    entity: CustomerRevenueMetric
-    fields: [customer_id]
-
-governance:
-  classification:
-    CustomerRevenueMetric.customer_id: INTERNAL
-  stewards:
-    executive_kpis: bi-team@example.com
-    customer_kpis: bi-team@example.com
-  retention:
-    period: 7y
-    policy: reporting_contract
-
-glossary:
-  - term: Gross Revenue
-    abbreviation: GR
-    definition: Sum of net revenue values over the reporting grain.
-    owner: bi-team@example.com
-    related_fields:
-      - DailyRevenueMetric.gross_revenue
-    tags: [KPI, FINANCE]
-  - term: Average Order Value
-    abbreviation: AOV
-    definition: Gross revenue divided by distinct order count for the period.
-    owner: bi-team@example.com
-    related_fields:
-      - DailyRevenueMetric.avg_order_value
-    tags: [KPI, COMMERCE]
-  - term: Customer Revenue
-    definition: Total revenue attributed to a customer within report_month.
-    owner: bi-team@example.com
-    related_fields:
-      - CustomerRevenueMetric.customer_revenue
-    tags: [KPI, CUSTOMER]
-
-rules:
-  - name: gross_revenue_non_negative
-    target: DailyRevenueMetric.gross_revenue
-    expression: "value >= 0"
-    severity: error
-  - name: order_count_non_negative
-    target: DailyRevenueMetric.order_count
-    expression: "value >= 0"
-    severity: error
-  - name: customer_revenue_non_negative
-    target: CustomerRevenueMetric.customer_revenue
-    expression: "value >= 0"
-    severity: error
-
-metrics:
-  - name: daily_gross_revenue
-    entity: DailyRevenueMetric
-    description: Daily gross revenue KPI for executive reporting.
-    expression: gross_revenue
-    aggregation: sum
-    grain: [metric_date]
-    dimensions: [metric_date]
-    time_dimension: metric_date
-    owner: bi-team@example.com
-    tags: [KPI, METRIC, FINANCE]
-  - name: daily_order_count
-    entity: DailyRevenueMetric
-    description: Daily distinct order count.
-    expression: order_count
-    aggregation: count_distinct
-    grain: [metric_date]
-    dimensions: [metric_date]
-    time_dimension: metric_date
-    owner: bi-team@example.com
-    tags: [KPI, METRIC, VOLUME]
-  - name: monthly_customer_revenue
-    entity: CustomerRevenueMetric
-    description: Monthly revenue by customer.
-    expression: customer_revenue
-    aggregation: sum
-    grain: [customer_id, report_month]
-    dimensions: [customer_id]
-    time_dimension: report_month
-    owner: bi-team@example.com
-    tags: [KPI, METRIC, CUSTOMER]
-
-display:
-  sections:
-    - name: Executive KPIs
-      entities: [DailyRevenueMetric]
-    - name: Customer KPIs
-      entities: [CustomerRevenueMetric]
-"""
-
-END_TO_END_POLICY = """pack:
-  name: end_to_end_dictionary
-  version: 1.0.0
-  description: Strict policy profile for end-to-end modeling + dictionary-first projects.
-  extends: strict.policy.yaml
-
-policies:
-  - id: REQUIRE_MODEL_GOVERNANCE
-    type: custom_expression
-    severity: error
-    params:
-      scope: model
-      expression: "has_governance"
-      message: "Model '{name}' must define governance metadata."
-
-  - id: REQUIRE_MODEL_GLOSSARY
-    type: custom_expression
-    severity: error
-    params:
-      scope: model
-      expression: "has_glossary"
-      message: "Model '{name}' must define glossary terms for dictionary coverage."
-
-  - id: REQUIRE_MODEL_RULES
-    type: custom_expression
-    severity: error
-    params:
-      scope: model
-      expression: "has_rules"
-      message: "Model '{name}' must define rules for business logic checks."
-
-  - id: REQUIRE_REPORT_LAYER_METRICS
-    type: custom_expression
-    severity: error
-    params:
-      scope: model
-      expression: "layer != 'report' or has_metrics"
-      message: "Report layer model '{name}' must define metrics."
-
-  - id: REQUIRE_ENTITY_SUBJECT_AREA
-    type: custom_expression
-    severity: error
-    params:
-      scope: entity
-      expression: "subject_area != ''"
-      message: "Entity '{name}' must define subject_area for dictionary organization."
-
-  - id: REQUIRE_ENTITY_DESCRIPTION
-    type: custom_expression
-    severity: error
-    params:
-      scope: entity
-      expression: "has_description"
-      message: "Entity '{name}' must include a description."
-
-  - id: REQUIRE_FIELD_DESCRIPTION
-    type: custom_expression
-    severity: error
-    params:
-      scope: field
-      expression: "primary_key or has_description"
-      message: "Field '{name}' must include a description unless it is a primary key."
-
-  - id: REQUIRE_FIELD_TAGS
-    type: custom_expression
-    severity: error
-    params:
-      scope: field
-      expression: "primary_key or tags != []"
-      message: "Field '{name}' must include at least one tag unless it is a primary key."
-"""
-
-END_TO_END_DICTIONARY_README = """# End-to-End Dictionary Workflow
-
-This project is scaffolded to keep architecture, transformation logic, reporting metrics,
-and business dictionary metadata in one programmable YAML system.
-
-## Layers
-
-1. `models/source/`:
-   - Physical source contracts (warehouse/raw systems).
-2. `models/transform/`:
-   - Business-conformed entities and relationships.
-3. `models/report/`:
-   - Reporting semantic contracts and KPI-focused glossary terms.
-
-## Required Sections Per Model
-
-1. `model` metadata (`name`, `version`, `owners`, `state`, `description`).
-2. `entities` with field-level descriptions and tags.
-3. `grain` in transform/report entities.
-4. `governance` classification/stewardship metadata.
-5. `glossary` terms for dictionary clarity.
-6. `rules` for enforceable business logic.
-7. `metrics` in report models for KPI contracts.
-
-## Mandatory Validation Flow
-
-```bash
-datalex validate-all --glob "models/**/*.model.yaml"
-datalex policy-check models/source/source_sales_raw.model.yaml --policy policies/end_to_end_dictionary.policy.yaml --inherit
-datalex policy-check models/transform/commerce_transform.model.yaml --policy policies/end_to_end_dictionary.policy.yaml --inherit
-datalex policy-check models/report/commerce_reporting.model.yaml --policy policies/end_to_end_dictionary.policy.yaml --inherit
-datalex resolve-project models
-datalex generate docs models/report/commerce_reporting.model.yaml --format html --out docs/dictionary/reporting-dictionary.html
-```
-"""
 
 
+# Memoized: these run during argparse `default=` evaluation, and each
+# Path.cwd() is a getcwd syscall the process pays before any command runs.
+@lru_cache(maxsize=1)
 def _default_schema_path() -> str:
     return str(Path.cwd() / "schemas" / "model.schema.json")
 
 
+@lru_cache(maxsize=1)
 def _default_policy_schema_path() -> str:
     return str(Path.cwd() / "schemas" / "policy.schema.json")
 
 
+@lru_cache(maxsize=1)
 def _default_policy_path() -> str:
     return str(Path.cwd() / "policies" / "default.policy.yaml")
 
@@ -731,8 +105,9 @@ def _print_issues(issues: List[Issue]) -> None:
     if not issues:
         print("No issues found.")
         return
-    for line in to_lines(issues):
-        print(line)
+    # One write for the whole block — per-line print() pays a stdio lock and
+    # often a syscall per issue, which adds up on lint-heavy models.
+    sys.stdout.write("\n".join(to_lines(issues)) + "\n")
 
 
 def _combined_issues(model: Dict[str, Any], schema: Dict[str, Any]) -> List[Issue]:
@@ -810,8 +185,98 @@ def _resolve_pull_output_path(args: argparse.Namespace, model_name: str) -> Tupl
     return True, str(project_dir / file_name)
 
 
-def _validate_model_file(model_path: str, schema: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Issue]]:
-    model = load_yaml_model(model_path)
+_MODEL_MEMO: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+
+def _load_model(path: str) -> Dict[str, Any]:
+    """load_yaml_model with a per-process memo keyed on (abspath, mtime, size).
+
+    Commands that read the same file more than once in a process (gate old/new,
+    scripted chains calling main() repeatedly) skip the re-parse. Callers must
+    treat the returned dict as read-only; mutating commands load directly.
+    """
+    try:
+        abspath = os.path.abspath(path)
+        st = os.stat(abspath)
+    except OSError:
+        return load_yaml_model(path)
+    key = (abspath, st.st_mtime_ns, st.st_size)
+    model = _MODEL_MEMO.get(key)
+    if model is None:
+        model = _MODEL_MEMO[key] = load_yaml_model(path)
+    return model
+
+
+def _parse_cache_dir() -> Path:
+    """Per-user directory for the parsed-model JSON cache.
+
+    Lives under the XDG cache root (~/.cache by default) rather than the
+    working directory, so cache files never pollute model repositories.
+    DATALEX_CACHE_DIR overrides the location, e.g. for CI runners.
+    """
+    override = os.environ.get("DATALEX_CACHE_DIR")
+    if override:
+        return Path(override)
+    root = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(root) / "datalex" / "models"
+
+
+def _load_model_cached(path: str, use_cache: bool = True) -> Dict[str, Any]:
+    """load_yaml_model with an on-disk parse cache in the user cache dir.
+
+    Entries are keyed on (absolute path, mtime_ns, size), so an edited file
+    misses the cache automatically. JSON re-reads are much cheaper than YAML
+    parses, which makes back-to-back diff/gate/changelog runs in CI loops
+    nearly free. Caching is skipped for payloads JSON can't round-trip
+    (e.g. unquoted YAML dates) so cached and uncached loads stay identical.
+    """
+    if not use_cache:
+        return load_yaml_model(path)
+    try:
+        abspath = os.path.abspath(path)
+        st = os.stat(abspath)
+    except OSError:
+        return load_yaml_model(path)
+
+    memo_key = (abspath, st.st_mtime_ns, st.st_size)
+    memoized = _MODEL_MEMO.get(memo_key)
+    if memoized is not None:
+        return memoized
+
+    key = f"{hashlib.sha1(abspath.encode('utf-8')).hexdigest()}-{st.st_mtime_ns}-{st.st_size}.json"
+    cache_path = _parse_cache_dir() / key
+    try:
+        cached_text = cache_path.read_text(encoding="utf-8")
+    except OSError:
+        cached_text = None
+    if cached_text is not None:
+        try:
+            cached = json.loads(cached_text)
+            if isinstance(cached, dict):
+                _MODEL_MEMO[memo_key] = cached
+                return cached
+        except ValueError:
+            pass
+
+    model = _MODEL_MEMO[memo_key] = load_yaml_model(path)
+    try:
+        payload = json.dumps(model, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return model
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(payload, encoding="utf-8")
+    except OSError:
+        pass
+    return model
+
+
+def _validate_model_file(
+    model_path: str,
+    schema: Dict[str, Any],
+    use_cache: bool = False,
+) -> Tuple[Dict[str, Any], List[Issue]]:
+    model = _load_model_cached(model_path, use_cache=use_cache) if use_cache else load_yaml_model(model_path)
     issues = _combined_issues(model, schema)
     return model, issues
 
@@ -820,9 +285,7 @@ def _print_issue_block(prefix: str, issues: List[Issue]) -> None:
     if not issues:
         print(f"{prefix}: No issues found.")
         return
-    print(f"{prefix}:")
-    for line in to_lines(issues):
-        print(f"  {line}")
+    sys.stdout.write(f"{prefix}:\n  " + "\n  ".join(to_lines(issues)) + "\n")
 
 
 def _issues_as_json(issues: List[Issue]) -> List[Dict[str, str]]:
@@ -838,12 +301,12 @@ def _issues_as_json(issues: List[Issue]) -> List[Dict[str, str]]:
 
 
 def _write_yaml(path: str, payload: Dict[str, Any]) -> None:
-    output = yaml.safe_dump(payload, sort_keys=False)
+    output = yaml.dump(payload, Dumper=_YamlDumper, sort_keys=False)
     Path(path).write_text(output, encoding="utf-8")
 
 
 def _print_or_write_yaml(payload: Dict[str, Any], out: str = "") -> None:
-    output = yaml.safe_dump(payload, sort_keys=False, default_flow_style=False, allow_unicode=True)
+    output = yaml.dump(payload, Dumper=_YamlDumper, sort_keys=False, default_flow_style=False, allow_unicode=True)
     if out:
         Path(out).write_text(output, encoding="utf-8")
         print(f"Wrote model: {out}")
@@ -862,35 +325,37 @@ def _init_schemas_and_policies(root: Path) -> List[Path]:
     default_policy_dst = root / "policies" / "default.policy.yaml"
     strict_policy_dst = root / "policies" / "strict.policy.yaml"
 
+    # One scandir sweep per source directory instead of exists()+read_text
+    # per file — fewer round trips, which matters on network filesystems —
+    # and raw bytes in/out skips the UTF-8 decode/encode.
+    blobs: Dict[str, bytes] = {}
+    for src_dir in (Path.cwd() / "schemas", Path.cwd() / "policies"):
+        try:
+            entries = os.scandir(src_dir)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    try:
+                        blobs[entry.name] = Path(entry.path).read_bytes()
+                    except OSError:
+                        pass
+
     if not schema_dst.exists():
-        repo_schema = Path.cwd() / "schemas" / "model.schema.json"
-        if repo_schema.exists():
-            schema_dst.write_text(repo_schema.read_text(encoding="utf-8"), encoding="utf-8")
-        else:
-            schema_dst.write_text("{}", encoding="utf-8")
+        schema_dst.write_bytes(blobs.get("model.schema.json", b"{}"))
     created.append(schema_dst)
 
     if not policy_schema_dst.exists():
-        repo_policy_schema = Path.cwd() / "schemas" / "policy.schema.json"
-        if repo_policy_schema.exists():
-            policy_schema_dst.write_text(
-                repo_policy_schema.read_text(encoding="utf-8"), encoding="utf-8"
-            )
-        else:
-            policy_schema_dst.write_text("{}", encoding="utf-8")
+        policy_schema_dst.write_bytes(blobs.get("policy.schema.json", b"{}"))
     created.append(policy_schema_dst)
 
-    repo_policy_dir = Path.cwd() / "policies"
-    if not default_policy_dst.exists():
-        repo_default = repo_policy_dir / "default.policy.yaml"
-        if repo_default.exists():
-            default_policy_dst.write_text(repo_default.read_text(encoding="utf-8"), encoding="utf-8")
+    if not default_policy_dst.exists() and "default.policy.yaml" in blobs:
+        default_policy_dst.write_bytes(blobs["default.policy.yaml"])
     created.append(default_policy_dst)
 
-    if not strict_policy_dst.exists():
-        repo_strict = repo_policy_dir / "strict.policy.yaml"
-        if repo_strict.exists():
-            strict_policy_dst.write_text(repo_strict.read_text(encoding="utf-8"), encoding="utf-8")
+    if not strict_policy_dst.exists() and "strict.policy.yaml" in blobs:
+        strict_policy_dst.write_bytes(blobs["strict.policy.yaml"])
     created.append(strict_policy_dst)
 
     return created
@@ -921,11 +386,11 @@ def cmd_init(args: argparse.Namespace) -> int:
         config_dst = root / "dm.config.yaml"
 
         if not shared_dst.exists():
-            shared_dst.write_text(MULTI_MODEL_SHARED, encoding="utf-8")
+            shared_dst.write_text(_read_template("shared_dimensions.model.yaml"), encoding="utf-8")
         created.append(shared_dst)
 
         if not orders_dst.exists():
-            orders_dst.write_text(MULTI_MODEL_ORDERS, encoding="utf-8")
+            orders_dst.write_text(_read_template("orders.model.yaml"), encoding="utf-8")
         created.append(orders_dst)
 
         if not config_dst.exists():
@@ -958,23 +423,23 @@ def cmd_init(args: argparse.Namespace) -> int:
         config_dst = root / "dm.config.yaml"
 
         if not source_dst.exists():
-            source_dst.write_text(END_TO_END_SOURCE, encoding="utf-8")
+            source_dst.write_text(_read_template("end_to_end_source.model.yaml"), encoding="utf-8")
         created.append(source_dst)
 
         if not transform_dst.exists():
-            transform_dst.write_text(END_TO_END_TRANSFORM, encoding="utf-8")
+            transform_dst.write_text(_read_template("end_to_end_transform.model.yaml"), encoding="utf-8")
         created.append(transform_dst)
 
         if not report_dst.exists():
-            report_dst.write_text(END_TO_END_REPORT, encoding="utf-8")
+            report_dst.write_text(_read_template("end_to_end_report.model.yaml"), encoding="utf-8")
         created.append(report_dst)
 
         if not dictionary_readme_dst.exists():
-            dictionary_readme_dst.write_text(END_TO_END_DICTIONARY_README, encoding="utf-8")
+            dictionary_readme_dst.write_text(_read_template("end_to_end_dictionary_readme.md"), encoding="utf-8")
         created.append(dictionary_readme_dst)
 
         if not end_to_end_policy_dst.exists():
-            end_to_end_policy_dst.write_text(END_TO_END_POLICY, encoding="utf-8")
+            end_to_end_policy_dst.write_text(_read_template("end_to_end_dictionary.policy.yaml"), encoding="utf-8")
         created.append(end_to_end_policy_dst)
 
         if not config_dst.exists():
@@ -1000,7 +465,7 @@ def cmd_init(args: argparse.Namespace) -> int:
         config_dst = root / "dm.config.yaml"
 
         if not sample_dst.exists():
-            sample_dst.write_text(STARTER_MODEL, encoding="utf-8")
+            sample_dst.write_text(_read_template("starter.model.yaml"), encoding="utf-8")
         created.append(sample_dst)
 
         if not config_dst.exists():
@@ -1028,13 +493,15 @@ def cmd_validate(args: argparse.Namespace) -> int:
 
 
 def cmd_lint(args: argparse.Namespace) -> int:
-    model = load_yaml_model(args.model)
+    model = _load_model(args.model)
     issues = lint_issues(model)
     _print_issues(issues)
     return 1 if has_errors(issues) else 0
 
 
 def cmd_compile(args: argparse.Namespace) -> int:
+    from datalex_core import compile_model
+
     schema = load_schema(args.schema)
     model, issues = _validate_model_file(args.model, schema)
     if has_errors(issues):
@@ -1042,46 +509,155 @@ def cmd_compile(args: argparse.Namespace) -> int:
         return 1
 
     canonical = compile_model(model)
-    output = json.dumps(canonical, indent=2, sort_keys=False)
 
     if args.out:
-        Path(args.out).write_text(output + "\n", encoding="utf-8")
+        _dump_json_to(args.out, canonical)
         print(f"Wrote canonical model: {args.out}")
     else:
-        print(output)
+        print(_json_dumps(canonical))
 
     return 0
 
 
 def cmd_diff(args: argparse.Namespace) -> int:
-    old_model = load_yaml_model(args.old)
-    new_model = load_yaml_model(args.new)
+    from datalex_core import semantic_diff
+
+    use_cache = not getattr(args, "no_cache", False)
+    old_model = _load_model_cached(args.old, use_cache=use_cache)
+    new_model = _load_model_cached(args.new, use_cache=use_cache)
     diff = semantic_diff(old_model, new_model)
-    print(json.dumps(diff, indent=2))
+    print(_json_dumps(diff))
     return 0
 
 
+def _iter_model_files(pattern: str, exclude: List[str]) -> List[str]:
+    """Expand a recursive glob with an os.scandir walk that prunes excludes.
+
+    glob.glob(recursive=True) stats every entry under the tree before the
+    --exclude filter runs, so node_modules/.git/.venv get fully walked just
+    to be thrown away. This walker skips excluded directories without
+    descending, matching components with fnmatch and treating `**` as zero
+    or more directories (same semantics as glob).
+    """
+    import fnmatch
+
+    if os.path.isabs(pattern):
+        # Rare in practice; keep stdlib glob for absolute patterns.
+        return [p for p in glob.glob(pattern, recursive=True) if os.path.isfile(p)]
+
+    # Only `**/name/**` excludes (the node_modules/.git/.venv defaults) can
+    # be pruned by bare directory name: the leading `**` makes the pattern
+    # depth-independent, so the name alone identifies the subtree. Anchored
+    # excludes like models/legacy/** must not prune — a sibling other/legacy/
+    # is not excluded — and file-level patterns must not prune their parent
+    # directories. Both are filtered out of the match results by the
+    # caller's compiled exclude regex instead.
+    prune_names = set()
+    for pat in exclude:
+        pat_parts = tuple(part for part in pat.split("/") if part)
+        if len(pat_parts) == 3 and pat_parts[0] == "**" and pat_parts[2] == "**" and pat_parts[1] not in ("**", "*"):
+            prune_names.add(pat_parts[1])
+
+    def _walk(dirpath: str, parts: Tuple[str, ...]):
+        if not parts:
+            # A trailing `**` matched zero directories: every file right here
+            # matches (deeper levels are covered by the `**` recursion below).
+            try:
+                entries = os.scandir(dirpath)
+            except OSError:
+                return
+            with entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        yield entry.path
+            return
+        head, rest = parts[0], parts[1:]
+        if head == "**":
+            yield from _walk(dirpath, rest)  # `**` matching zero directories
+            try:
+                entries = os.scandir(dirpath)
+            except OSError:
+                return
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False) and entry.name not in prune_names:
+                        yield from _walk(entry.path, parts)
+            return
+        try:
+            entries = os.scandir(dirpath)
+        except OSError:
+            return
+        with entries:
+            for entry in entries:
+                if not fnmatch.fnmatch(entry.name, head):
+                    continue
+                if rest:
+                    if entry.is_dir(follow_symlinks=False) and entry.name not in prune_names:
+                        yield from _walk(entry.path, rest)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry.path
+
+    parts = tuple(part for part in pattern.split("/") if part not in ("", "."))
+    if not parts:
+        return []
+    found = {path[2:] if path.startswith("./") else path for path in _walk(".", parts)}
+    return sorted(found)
+
+
+def _validate_one(path_and_schema: Tuple[str, str]) -> Tuple[str, List[Issue]]:
+    """Worker for cmd_validate_all: validate one file against the schema path.
+
+    Takes the schema *path* rather than the parsed dict so the task payload
+    stays small; load_schema's memoization makes the per-worker reload free
+    after the first file.
+    """
+    path, schema_path = path_and_schema
+    schema = load_schema(schema_path)
+    _, issues = _validate_model_file(path, schema)
+    return path, issues
+
+
 def cmd_validate_all(args: argparse.Namespace) -> int:
     schema = load_schema(args.schema)
-    paths = sorted(
-        {
-            Path(path)
-            for path in glob.glob(args.glob, recursive=True)
-            if Path(path).is_file()
-        }
-    )
+    # Already unique, sorted, and stat-checked by the walker — no Path
+    # round-trip or per-entry is_file() needed here.
+    paths = _iter_model_files(args.glob, args.exclude)
 
     if not paths:
         print(f"No files matched glob: {args.glob}")
         return 0
 
-    failing_files = 0
-    for path in paths:
-        if any(path.match(pattern) for pattern in args.exclude):
-            continue
+    # The walk already pruned excluded directories; this catches exclude
+    # patterns that target individual files rather than whole folders.
+    # Compiled once into a single alternation instead of re-tokenizing every
+    # pattern per path via PurePath.match.
+    if args.exclude:
+        import fnmatch
 
-        _, issues = _validate_model_file(str(path), schema)
-        _print_issue_block(str(path), issues)
+        excl_re = re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in args.exclude))
+        included = [path for path in paths if not excl_re.match(path)]
+    else:
+        included = paths
+
+    # Per-file validation (YAML parse + jsonschema + lint) is CPU-bound and
+    # independent, so large repos fan out across a process pool. Small runs
+    # stay sequential — pool startup would cost more than it saves.
+    if len(included) > 4 and (os.cpu_count() or 1) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(
+                executor.map(
+                    _validate_one,
+                    ((path, args.schema) for path in included),
+                )
+            )
+    else:
+        results = [_validate_one((path, args.schema)) for path in included]
+
+    failing_files = 0
+    for path_str, issues in results:
+        _print_issue_block(path_str, issues)
         if has_errors(issues):
             failing_files += 1
 
@@ -1094,10 +670,13 @@ def cmd_validate_all(args: argparse.Namespace) -> int:
 
 
 def cmd_gate(args: argparse.Namespace) -> int:
+    from datalex_core import semantic_diff
+
     schema = load_schema(args.schema)
 
-    old_model, old_issues = _validate_model_file(args.old, schema)
-    new_model, new_issues = _validate_model_file(args.new, schema)
+    use_cache = not getattr(args, "no_cache", False)
+    old_model, old_issues = _validate_model_file(args.old, schema, use_cache=use_cache)
+    new_model, new_issues = _validate_model_file(args.new, schema, use_cache=use_cache)
 
     _print_issue_block(f"Old model ({args.old})", old_issues)
     _print_issue_block(f"New model ({args.new})", new_issues)
@@ -1109,7 +688,7 @@ def cmd_gate(args: argparse.Namespace) -> int:
 
     diff = semantic_diff(old_model, new_model)
     if args.output_json:
-        print(json.dumps(diff, indent=2))
+        print(_json_dumps(diff))
     else:
         summary = diff["summary"]
         print("Diff summary:")
@@ -1299,6 +878,8 @@ def _gate_render_pr_comment(review: Dict[str, Any]) -> str:
 
 
 def cmd_policy_check(args: argparse.Namespace) -> int:
+    from datalex_core import load_policy_pack, load_policy_pack_with_inheritance, merge_policy_packs, policy_issues
+
     schema = load_schema(args.schema)
     policy_schema = load_schema(args.policy_schema)
 
@@ -1325,17 +906,18 @@ def cmd_policy_check(args: argparse.Namespace) -> int:
     _print_issue_block("Policy evaluation", evaluated_issues)
 
     if args.output_json:
+        severity_counts = Counter(item.severity for item in evaluated_issues)
         payload = {
             "model": args.model,
             "policy": policy_paths if len(policy_paths) > 1 else policy_paths[0],
             "summary": {
-                "error_count": len([item for item in evaluated_issues if item.severity == "error"]),
-                "warning_count": len([item for item in evaluated_issues if item.severity == "warn"]),
-                "info_count": len([item for item in evaluated_issues if item.severity == "info"]),
+                "error_count": severity_counts.get("error", 0),
+                "warning_count": severity_counts.get("warn", 0),
+                "info_count": severity_counts.get("info", 0),
             },
             "issues": _issues_as_json(evaluated_issues),
         }
-        print(json.dumps(payload, indent=2))
+        print(_json_dumps(payload))
 
     if has_errors(evaluated_issues):
         print("Policy check failed.")
@@ -1346,6 +928,8 @@ def cmd_policy_check(args: argparse.Namespace) -> int:
 
 
 def cmd_generate_sql(args: argparse.Namespace) -> int:
+    from datalex_core import generate_sql_ddl
+
     schema = load_schema(args.schema)
     model, issues = _validate_model_file(args.model, schema)
 
@@ -1364,6 +948,8 @@ def cmd_generate_sql(args: argparse.Namespace) -> int:
 
 
 def cmd_generate_dbt(args: argparse.Namespace) -> int:
+    from datalex_core import write_dbt_scaffold
+
     schema = load_schema(args.schema)
     model, issues = _validate_model_file(args.model, schema)
 
@@ -1386,6 +972,8 @@ def cmd_generate_dbt(args: argparse.Namespace) -> int:
 
 
 def cmd_generate_metadata(args: argparse.Namespace) -> int:
+    from datalex_core import compile_model
+
     schema = load_schema(args.schema)
     model, issues = _validate_model_file(args.model, schema)
 
@@ -1410,18 +998,18 @@ def cmd_generate_metadata(args: argparse.Namespace) -> int:
         "governance": canonical.get("governance", {}),
         "generated_by": "datalex generate metadata",
     }
-    output = json.dumps(payload, indent=2)
-
     if args.out:
-        Path(args.out).write_text(output + "\n", encoding="utf-8")
+        _dump_json_to(args.out, payload)
         print(f"Wrote metadata export: {args.out}")
     else:
-        print(output)
+        print(_json_dumps(payload))
 
     return 0
 
 
 def cmd_import_sql(args: argparse.Namespace) -> int:
+    from datalex_core import import_sql_ddl
+
     ddl_text = Path(args.input).read_text(encoding="utf-8")
     model = import_sql_ddl(
         ddl_text=ddl_text,
@@ -1438,12 +1026,14 @@ def cmd_import_sql(args: argparse.Namespace) -> int:
         _write_yaml(args.out, model)
         print(f"Wrote imported YAML model: {args.out}")
     else:
-        print(yaml.safe_dump(model, sort_keys=False))
+        print(yaml.dump(model, Dumper=_YamlDumper, sort_keys=False))
 
     return 1 if has_errors(issues) else 0
 
 
 def cmd_import_dbml(args: argparse.Namespace) -> int:
+    from datalex_core import import_dbml
+
     dbml_text = Path(args.input).read_text(encoding="utf-8")
     model = import_dbml(
         dbml_text=dbml_text,
@@ -1460,12 +1050,14 @@ def cmd_import_dbml(args: argparse.Namespace) -> int:
         _write_yaml(args.out, model)
         print(f"Wrote imported YAML model: {args.out}")
     else:
-        print(yaml.safe_dump(model, sort_keys=False))
+        print(yaml.dump(model, Dumper=_YamlDumper, sort_keys=False))
 
     return 1 if has_errors(issues) else 0
 
 
 def cmd_import_spark_schema(args: argparse.Namespace) -> int:
+    from datalex_core import import_spark_schema
+
     text = Path(args.input).read_text(encoding="utf-8")
     model = import_spark_schema(
         schema_text=text,
@@ -1483,12 +1075,14 @@ def cmd_import_spark_schema(args: argparse.Namespace) -> int:
         _write_yaml(args.out, model)
         print(f"Wrote imported YAML model: {args.out}")
     else:
-        print(yaml.safe_dump(model, sort_keys=False))
+        print(yaml.dump(model, Dumper=_YamlDumper, sort_keys=False))
 
     return 1 if has_errors(issues) else 0
 
 
 def cmd_import_dbt(args: argparse.Namespace) -> int:
+    from datalex_core import import_dbt_schema_yml
+
     schema_text = Path(args.input).read_text(encoding="utf-8")
     model = import_dbt_schema_yml(
         schema_yml_text=schema_text,
@@ -1505,7 +1099,7 @@ def cmd_import_dbt(args: argparse.Namespace) -> int:
         _write_yaml(args.out, model)
         print(f"Wrote imported YAML model: {args.out}")
     else:
-        print(yaml.safe_dump(model, sort_keys=False))
+        print(yaml.dump(model, Dumper=_YamlDumper, sort_keys=False))
 
     return 1 if has_errors(issues) else 0
 
@@ -1957,6 +1551,8 @@ def cmd_serve(args: argparse.Namespace) -> int:
 
 def cmd_dbt_sync(args: argparse.Namespace) -> int:
     """Merge DataLex model metadata into an existing dbt schema.yml (non-destructive)."""
+    from datalex_core import sync_dbt_schema_yml
+
     model = load_yaml_model(args.model)
     dbt_schema_path = Path(args.dbt_schema)
     if not dbt_schema_path.exists():
@@ -2036,6 +1632,8 @@ def cmd_emit_catalog(args: argparse.Namespace) -> int:
     Targets: atlan | datahub | openmetadata. Output is one JSON file per
     model under --out, named `<target>-<model_name>.json`.
     """
+    from datalex_core import compile_model
+
     from datalex_core.exporters import available_targets, export_catalog
 
     target = (args.target or "").lower()
@@ -2059,7 +1657,7 @@ def cmd_emit_catalog(args: argparse.Namespace) -> int:
     name = compiled.get("model", {}).get("name") or "datalex_model"
     safe_name = re.sub(r"[^A-Za-z0-9_.-]+", "_", str(name))
     out_path = out_dir / f"{target}-{safe_name}.json"
-    out_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    _dump_json_to(str(out_path), payload)
     print(f"[catalog] wrote {target} payload → {out_path}")
     return 0
 
@@ -2129,6 +1727,8 @@ def cmd_dbt_docs_reindex(args: argparse.Namespace) -> int:
 
 def cmd_dbt_push(args: argparse.Namespace) -> int:
     """Push DataLex metadata into all schema.yml files found in a dbt project directory."""
+    from datalex_core import sync_dbt_schema_yml
+
     model = load_yaml_model(args.model)
     dbt_project_root = Path(args.dbt_project)
     if not dbt_project_root.is_dir():
@@ -2166,6 +1766,8 @@ def _build_connector_extra(args: argparse.Namespace) -> Dict[str, Any]:
 
 
 def cmd_pull(args: argparse.Namespace) -> int:
+    from datalex_core import ConnectorConfig, get_connector, list_connectors
+
     connector_type = args.connector
     connector = get_connector(connector_type)
     if connector is None:
@@ -2216,7 +1818,17 @@ def cmd_pull(args: argparse.Namespace) -> int:
         return 1
 
     print(f"Pulling schema from {connector.display_name}...")
-    result = connector.pull_schema(config)
+    schemas = getattr(args, "schemas", None)
+    if schemas is not None:
+        # Multi-schema pull: connectors that support it fan the per-schema
+        # pulls out concurrently and merge; a bare --schemas means every
+        # schema in the database.
+        if not hasattr(connector, "pull_all"):
+            print(f"--schemas is not supported by the {connector.display_name} connector", file=sys.stderr)
+            return 1
+        result = connector.pull_all(config, schemas or None)
+    else:
+        result = connector.pull_schema(config)
 
     print(f"\n{result.summary()}")
 
@@ -2256,7 +1868,7 @@ def cmd_pull(args: argparse.Namespace) -> int:
             _write_yaml(output_path_or_error, result.model)
             print(f"\nWrote model: {output_path_or_error}")
         else:
-            print("\n" + yaml.safe_dump(result.model, sort_keys=False))
+            print("\n" + yaml.dump(result.model, Dumper=_YamlDumper, sort_keys=False))
 
     return 0
 
@@ -2356,6 +1968,8 @@ def _write_dbt_aware_layout(
 
 
 def cmd_connectors(args: argparse.Namespace) -> int:
+    from datalex_core import list_connectors
+
     connectors = list_connectors()
     if getattr(args, "output_json", False):
         print(json.dumps(connectors, indent=2))
@@ -2372,6 +1986,8 @@ def cmd_connectors(args: argparse.Namespace) -> int:
 
 
 def _build_connector_config(args: argparse.Namespace) -> "ConnectorConfig":
+    from datalex_core import ConnectorConfig
+
     host, port = _normalize_host_and_port(
         getattr(args, "host", "") or "",
         getattr(args, "port", 0) or 0,
@@ -2397,6 +2013,8 @@ def _build_connector_config(args: argparse.Namespace) -> "ConnectorConfig":
 
 
 def cmd_schemas(args: argparse.Namespace) -> int:
+    from datalex_core import get_connector
+
     connector = get_connector(args.connector)
     if connector is None:
         print(f"Unknown connector: {args.connector}", file=sys.stderr)
@@ -2419,6 +2037,8 @@ def cmd_schemas(args: argparse.Namespace) -> int:
 
 
 def cmd_tables(args: argparse.Namespace) -> int:
+    from datalex_core import get_connector
+
     connector = get_connector(args.connector)
     if connector is None:
         print(f"Unknown connector: {args.connector}", file=sys.stderr)
@@ -2446,6 +2066,8 @@ def cmd_tables(args: argparse.Namespace) -> int:
 
 
 def cmd_generate_docs(args: argparse.Namespace) -> int:
+    from datalex_core import generate_html_docs, generate_markdown_docs, write_html_docs, write_markdown_docs
+
     model = load_yaml_model(args.model)
     fmt = args.format
 
@@ -2466,8 +2088,11 @@ def cmd_generate_docs(args: argparse.Namespace) -> int:
 
 
 def cmd_generate_changelog(args: argparse.Namespace) -> int:
-    old_model = load_yaml_model(args.old)
-    new_model = load_yaml_model(args.new)
+    from datalex_core import generate_changelog, semantic_diff, write_changelog
+
+    use_cache = not getattr(args, "no_cache", False)
+    old_model = _load_model_cached(args.old, use_cache=use_cache)
+    new_model = _load_model_cached(args.new, use_cache=use_cache)
     diff = semantic_diff(old_model, new_model)
 
     old_version = old_model.get("model", {}).get("version", "")
@@ -2483,9 +2108,39 @@ def cmd_generate_changelog(args: argparse.Namespace) -> int:
 
 
 def cmd_fmt(args: argparse.Namespace) -> int:
-    model = load_yaml_model(args.model)
+    from datalex_core import compile_model
+
+    model = _load_model(args.model)
     canonical = compile_model(model)
-    output = yaml.safe_dump(canonical, sort_keys=False, default_flow_style=False, allow_unicode=True)
+
+    output = ""
+    if getattr(args, "style", "fast") == "round-trip":
+        try:
+            from ruamel.yaml import YAML
+            from io import StringIO
+
+            rt = YAML()
+            rt.default_flow_style = False
+            rt.allow_unicode = True
+            rt.width = 10_000
+            buffer = StringIO()
+            rt.dump(canonical, buffer)
+            output = buffer.getvalue()
+        except ImportError:
+            print("ruamel.yaml is not installed; falling back to the fast emitter.")
+
+    if not output:
+        # Default width on purpose: fmt output must stay byte-identical to
+        # what earlier releases wrote, or --write reflows every long scalar
+        # in already-formatted repos. The no-wrap style lives behind
+        # --style round-trip.
+        output = yaml.dump(
+            canonical,
+            Dumper=_YamlDumper,
+            sort_keys=False,
+            default_flow_style=False,
+            allow_unicode=True,
+        )
 
     if args.write:
         Path(args.model).write_text(output, encoding="utf-8")
@@ -2500,38 +2155,38 @@ def cmd_fmt(args: argparse.Namespace) -> int:
 
 
 def cmd_stats(args: argparse.Namespace) -> int:
-    model = load_yaml_model(args.model)
+    model = _load_model(args.model)
     entities = model.get("entities", [])
     relationships = model.get("relationships", [])
     indexes = model.get("indexes", [])
     glossary = model.get("glossary", [])
     rules = model.get("rules", [])
 
-    total_fields = sum(len(e.get("fields", [])) for e in entities)
-    pk_count = sum(
-        1 for e in entities for f in e.get("fields", []) if f.get("primary_key")
-    )
-    fk_count = sum(
-        1 for e in entities for f in e.get("fields", []) if f.get("foreign_key")
-    )
-    nullable_count = sum(
-        1 for e in entities for f in e.get("fields", []) if f.get("nullable", True)
-    )
-    described_fields = sum(
-        1 for e in entities for f in e.get("fields", []) if f.get("description")
-    )
-    deprecated_count = sum(
-        1 for e in entities for f in e.get("fields", []) if f.get("deprecated")
-    )
-    entity_types = {}
+    # One traversal of entities → fields updates every counter; the naive
+    # version walked the same nested structure seven times over.
+    total_fields = 0
+    pk_count = 0
+    fk_count = 0
+    nullable_count = 0
+    described_fields = 0
+    deprecated_count = 0
+    entity_types: Dict[str, int] = {}
+    subject_areas = set()
+    tags = set()
     for e in entities:
         t = e.get("type", "table")
         entity_types[t] = entity_types.get(t, 0) + 1
-    subject_areas = set(e.get("subject_area") for e in entities if e.get("subject_area"))
-    tags = set()
-    for e in entities:
-        for t in e.get("tags", []):
-            tags.add(t)
+        sa = e.get("subject_area")
+        if sa:
+            subject_areas.add(sa)
+        tags.update(e.get("tags", ()))
+        for f in e.get("fields", ()):
+            total_fields += 1
+            pk_count += bool(f.get("primary_key"))
+            fk_count += bool(f.get("foreign_key"))
+            nullable_count += bool(f.get("nullable", True))
+            described_fields += bool(f.get("description"))
+            deprecated_count += bool(f.get("deprecated"))
 
     desc_coverage = f"{described_fields}/{total_fields}" if total_fields else "0/0"
     desc_pct = f"{described_fields / total_fields * 100:.0f}%" if total_fields else "0%"
@@ -2556,7 +2211,7 @@ def cmd_stats(args: argparse.Namespace) -> int:
     }
 
     if args.output_json:
-        print(json.dumps(stats, indent=2))
+        print(_json_dumps(stats))
     else:
         print(f"Model: {stats['model_name']} v{stats['version']}")
         print(f"Entities: {stats['entity_count']}  ({', '.join(f'{v} {k}' for k, v in entity_types.items())})")
@@ -2578,7 +2233,9 @@ def cmd_stats(args: argparse.Namespace) -> int:
 
 def cmd_completeness(args: argparse.Namespace) -> int:
     """Score every entity in a model against the single-source-of-truth dimensions."""
-    model = load_yaml_model(args.model)
+    from datalex_core import completeness_as_dict, completeness_report
+
+    model = _load_model(args.model)
     report = completeness_report(model)
     data = completeness_as_dict(report)
 
@@ -2642,6 +2299,8 @@ def cmd_completeness(args: argparse.Namespace) -> int:
 
 
 def cmd_resolve(args: argparse.Namespace) -> int:
+    from datalex_core import resolve_model
+
     search_dirs = args.search_dir if args.search_dir else []
     resolved = resolve_model(args.model, search_dirs=search_dirs)
 
@@ -2653,7 +2312,7 @@ def cmd_resolve(args: argparse.Namespace) -> int:
     summary = resolved.to_graph_summary()
 
     if args.output_json:
-        print(json.dumps(summary, indent=2))
+        print(_json_dumps(summary))
     else:
         print(f"Root model: {summary['root_model']}")
         print(f"Models resolved: {summary['model_count']}")
@@ -2673,10 +2332,12 @@ def cmd_resolve(args: argparse.Namespace) -> int:
 
 
 def cmd_diff_all(args: argparse.Namespace) -> int:
+    from datalex_core import project_diff
+
     diff = project_diff(args.old, args.new)
 
     if args.output_json:
-        print(json.dumps(diff, indent=2))
+        print(_json_dumps(diff))
     else:
         s = diff["summary"]
         print(f"Project diff: {args.old} -> {args.new}")
@@ -2704,6 +2365,8 @@ def cmd_diff_all(args: argparse.Namespace) -> int:
 
 
 def cmd_transform(args: argparse.Namespace) -> int:
+    from datalex_core import transform_model
+
     schema = load_schema(args.schema)
     model, issues = _validate_model_file(args.model, schema)
     if has_errors(issues):
@@ -2722,6 +2385,8 @@ def cmd_transform(args: argparse.Namespace) -> int:
 
 
 def cmd_standards_check(args: argparse.Namespace) -> int:
+    from datalex_core import standards_issues
+
     schema = load_schema(args.schema)
     model, issues = _validate_model_file(args.model, schema)
     issues.extend(standards_issues(model))
@@ -2734,6 +2399,8 @@ def cmd_standards_check(args: argparse.Namespace) -> int:
 
 
 def cmd_standards_fix(args: argparse.Namespace) -> int:
+    from datalex_core import apply_standards_fixes
+
     model = load_yaml_model(args.model)
     fixed, changes = apply_standards_fixes(model)
 
@@ -2748,6 +2415,8 @@ def cmd_standards_fix(args: argparse.Namespace) -> int:
 
 
 def cmd_sync_compare(args: argparse.Namespace) -> int:
+    from datalex_core import semantic_diff
+
     current_model = load_yaml_model(args.current)
     candidate_model = load_yaml_model(args.candidate)
     diff = semantic_diff(current_model, candidate_model)
@@ -2756,6 +2425,8 @@ def cmd_sync_compare(args: argparse.Namespace) -> int:
 
 
 def cmd_sync_merge(args: argparse.Namespace) -> int:
+    from datalex_core import merge_models_preserving_docs
+
     current_model = load_yaml_model(args.current)
     candidate_model = load_yaml_model(args.candidate)
     merged = merge_models_preserving_docs(current_model, candidate_model)
@@ -2768,61 +2439,83 @@ def cmd_sync_pull(args: argparse.Namespace) -> int:
 
 
 def cmd_resolve_project(args: argparse.Namespace) -> int:
+    from datalex_core import resolve_project
+
     search_dirs = args.search_dir if args.search_dir else []
     results = resolve_project(args.directory, search_dirs=search_dirs)
 
-    total_issues = 0
-    all_models = []
-
-    for path, resolved in sorted(results.items()):
-        name = resolved.root_model.get("model", {}).get("name", "unknown")
-        imports = list(resolved.imported_models.keys())
-        entities = [e.get("name", "") for e in resolved.unified_entities()]
-        issue_count = len(resolved.issues)
-        total_issues += issue_count
-
-        all_models.append({
-            "name": name,
-            "file": path,
-            "imports": imports,
-            "entity_count": len(entities),
-            "entities": entities,
-            "issue_count": issue_count,
-            "issues": [
-                {"severity": i.severity, "code": i.code, "message": i.message}
-                for i in resolved.issues
-            ],
-        })
+    sorted_results = sorted(results.items())
+    total_issues = sum(len(resolved.issues) for _, resolved in sorted_results)
 
     if args.output_json:
-        print(json.dumps({"models": all_models, "total_issues": total_issues}, indent=2))
+        all_models = [
+            {
+                "name": resolved.root_model.get("model", {}).get("name", "unknown"),
+                "file": path,
+                "imports": list(resolved.imported_models.keys()),
+                "entity_count": len(resolved.unified_entities()),
+                "entities": [e.get("name", "") for e in resolved.unified_entities()],
+                "issue_count": len(resolved.issues),
+                "issues": [
+                    {"severity": i.severity, "code": i.code, "message": i.message}
+                    for i in resolved.issues
+                ],
+            }
+            for path, resolved in sorted_results
+        ]
+        print(_json_dumps({"models": all_models, "total_issues": total_issues}))
     else:
-        print(f"Project: {args.directory}")
-        print(f"Models found: {len(all_models)}")
-        for m in all_models:
-            imp_str = f" (imports: {', '.join(m['imports'])})" if m["imports"] else ""
-            status = "OK" if m["issue_count"] == 0 else f"{m['issue_count']} issues"
-            print(f"  {m['name']}: {m['entity_count']} entities{imp_str} [{status}]")
-            for iss in m["issues"]:
-                print(f"    [{iss['severity'].upper()}] {iss['code']}: {iss['message']}")
-        print(f"Total issues: {total_issues}")
+        # Human output reads straight off the resolved results — no point
+        # building the per-model/per-issue dicts the JSON branch needs.
+        lines = [f"Project: {args.directory}", f"Models found: {len(sorted_results)}"]
+        for _, resolved in sorted_results:
+            name = resolved.root_model.get("model", {}).get("name", "unknown")
+            imports = list(resolved.imported_models.keys())
+            imp_str = f" (imports: {', '.join(imports)})" if imports else ""
+            issue_count = len(resolved.issues)
+            status = "OK" if issue_count == 0 else f"{issue_count} issues"
+            lines.append(
+                f"  {name}: {len(resolved.unified_entities())} entities{imp_str} [{status}]"
+            )
+            lines.extend(
+                f"    [{i.severity.upper()}] {i.code}: {i.message}"
+                for i in resolved.issues
+            )
+        lines.append(f"Total issues: {total_issues}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     return 1 if total_issues > 0 else 0
 
 
-def cmd_schema(args: argparse.Namespace) -> int:
-    schema = load_schema(args.schema)
-    print(json.dumps(schema, indent=2))
+def _print_json_file(path: str) -> int:
+    """Stream a JSON file to stdout without a parse/re-serialize round trip.
+
+    print-schema exists so users and tools can pipe the active schema around;
+    the file is already JSON, so parsing it just to pretty-print wastes the
+    bulk of the command's runtime on large schemas. load_schema is kept as
+    the error path so missing files fail with the usual message.
+    """
+    try:
+        with open(path, "rb") as handle:
+            sys.stdout.buffer.write(handle.read())
+            sys.stdout.buffer.write(b"\n")
+            sys.stdout.buffer.flush()
+    except OSError:
+        print(_json_dumps(load_schema(path)))
     return 0
 
 
+def cmd_schema(args: argparse.Namespace) -> int:
+    return _print_json_file(args.schema)
+
+
 def cmd_policy_schema(args: argparse.Namespace) -> int:
-    schema = load_schema(args.policy_schema)
-    print(json.dumps(schema, indent=2))
-    return 0
+    return _print_json_file(args.policy_schema)
 
 
 def cmd_doctor(args: argparse.Namespace) -> int:
+    from datalex_core import diagnostics_as_json, format_diagnostics, run_diagnostics
+
     project_dir = getattr(args, "path", ".")
     results = run_diagnostics(project_dir)
 
@@ -2878,8 +2571,10 @@ def cmd_upgrade(args: argparse.Namespace) -> int:
 
 
 def cmd_migrate(args: argparse.Namespace) -> int:
-    old_model = load_yaml_model(args.old)
-    new_model = load_yaml_model(args.new)
+    from datalex_core import generate_migration, write_migration
+
+    old_model = _load_model(args.old)
+    new_model = _load_model(args.new)
     dialect = getattr(args, "dialect", "postgres")
 
     if args.out:
@@ -3004,7 +2699,7 @@ def _detect_destructive_statements(statements: List[str]) -> List[Dict[str, Any]
 
 
 def _write_apply_report(path: str, payload: Dict[str, Any]) -> None:
-    Path(path).write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    _dump_json_to(path, payload)
 
 
 class ApplyExecutionError(RuntimeError):
@@ -3020,7 +2715,7 @@ class ApplyExecutionError(RuntimeError):
         super().__init__(message)
 
 
-def _apply_snowflake(config: ConnectorConfig, statements: List[str], migration_name: str, checksum: str, ledger_table: str, skip_ledger: bool) -> None:
+def _apply_snowflake(config: "ConnectorConfig", statements: List[str], migration_name: str, checksum: str, ledger_table: str, skip_ledger: bool) -> None:
     import snowflake.connector
     from datalex_core.connectors.snowflake import _load_private_key
 
@@ -3074,7 +2769,7 @@ def _apply_snowflake(config: ConnectorConfig, statements: List[str], migration_n
         conn.close()
 
 
-def _apply_databricks(config: ConnectorConfig, statements: List[str], migration_name: str, checksum: str, ledger_table: str, skip_ledger: bool) -> None:
+def _apply_databricks(config: "ConnectorConfig", statements: List[str], migration_name: str, checksum: str, ledger_table: str, skip_ledger: bool) -> None:
     from databricks import sql
 
     conn = sql.connect(
@@ -3109,7 +2804,7 @@ def _apply_databricks(config: ConnectorConfig, statements: List[str], migration_
         conn.close()
 
 
-def _apply_bigquery(config: ConnectorConfig, statements: List[str], migration_name: str, checksum: str, ledger_table: str, skip_ledger: bool) -> None:
+def _apply_bigquery(config: "ConnectorConfig", statements: List[str], migration_name: str, checksum: str, ledger_table: str, skip_ledger: bool) -> None:
     from google.cloud import bigquery
 
     client = bigquery.Client(project=config.project)
@@ -3135,6 +2830,8 @@ def _apply_bigquery(config: ConnectorConfig, statements: List[str], migration_na
 
 
 def cmd_apply(args: argparse.Namespace) -> int:
+    from datalex_core import generate_migration, get_connector, load_policy_pack_with_inheritance, policy_issues
+
     connector_type = args.connector
     dialect = (getattr(args, "dialect", "") or connector_type).lower()
     started_ts = time.time()
@@ -3323,6 +3020,8 @@ def cmd_apply(args: argparse.Namespace) -> int:
 
 
 def cmd_completion(args: argparse.Namespace) -> int:
+    from datalex_core import generate_bash_completion, generate_fish_completion, generate_zsh_completion
+
     shell = args.shell
     if shell == "bash":
         print(generate_bash_completion())
@@ -3396,15 +3095,29 @@ def cmd_watch(args: argparse.Namespace) -> int:
         return 0
 
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(prog="datalex", description="DataLex CLI")
-    parser.add_argument(
-        "--version",
-        action="version",
-        version=f"%(prog)s {_cli_version()}",
-    )
-    sub = parser.add_subparsers(dest="command", required=True)
-
+# Common connection args helper
+def _add_conn_args(p):
+    p.add_argument("connector", help="Connector type (postgres, mysql, snowflake, bigquery, databricks, sqlserver, azure_sql, azure_fabric, redshift)")
+    p.add_argument("--host", help="Database host")
+    p.add_argument("--port", type=int, help="Database port")
+    p.add_argument("--database", help="Database name")
+    p.add_argument("--db-schema", help="Schema name")
+    p.add_argument("--user", help="Database user")
+    p.add_argument("--password", help="Database password")
+    p.add_argument("--warehouse", help="Snowflake warehouse")
+    p.add_argument("--project", help="BigQuery project ID")
+    p.add_argument("--dataset", help="BigQuery dataset")
+    p.add_argument("--catalog", help="Databricks catalog")
+    p.add_argument("--token", help="Access token")
+    p.add_argument("--http-path", help="Databricks SQL Warehouse/Cluster HTTP path")
+    p.add_argument("--odbc-driver", help="ODBC driver for SQL Server-family connectors")
+    p.add_argument("--encrypt", help="SQL Server encryption setting (yes/no)")
+    p.add_argument("--trust-server-certificate", help="SQL Server TrustServerCertificate setting (yes/no)")
+    p.add_argument("--private-key-path", help="Path to RSA private key PEM file (Snowflake key-pair auth)")
+    p.add_argument("--output-json", action="store_true", help="Print as JSON")
+
+
+def _register_serve(sub: argparse._SubParsersAction) -> None:
     # `datalex serve` — start the bundled api-server + web-app on a
     # single port. Registered first because it's the single most
     # important command for new users (pip install → serve → browse).
@@ -3427,6 +3140,8 @@ def build_parser() -> argparse.ArgumentParser:
     )
     serve_parser.set_defaults(func=cmd_serve)
 
+
+def _register_init(sub: argparse._SubParsersAction) -> None:
     init_parser = sub.add_parser("init", help="Initialize a new workspace")
     init_parser.add_argument("--path", default=".", help="Workspace path")
     init_parser.add_argument(
@@ -3442,26 +3157,37 @@ def build_parser() -> argparse.ArgumentParser:
     )
     init_parser.set_defaults(func=cmd_init)
 
+
+def _register_validate(sub: argparse._SubParsersAction) -> None:
     validate_parser = sub.add_parser("validate", help="Validate model with schema + semantic rules")
     validate_parser.add_argument("model", help="Path to model YAML")
     validate_parser.add_argument("--schema", default=_default_schema_path(), help="Path to JSON schema")
     validate_parser.set_defaults(func=cmd_validate)
 
+
+def _register_lint(sub: argparse._SubParsersAction) -> None:
     lint_parser = sub.add_parser("lint", help="Run semantic lint checks")
     lint_parser.add_argument("model", help="Path to model YAML")
     lint_parser.set_defaults(func=cmd_lint)
 
+
+def _register_compile(sub: argparse._SubParsersAction) -> None:
     compile_parser = sub.add_parser("compile", help="Compile model to canonical JSON")
     compile_parser.add_argument("model", help="Path to model YAML")
     compile_parser.add_argument("--schema", default=_default_schema_path(), help="Path to JSON schema")
     compile_parser.add_argument("--out", help="Output file for canonical JSON")
     compile_parser.set_defaults(func=cmd_compile)
 
+
+def _register_diff(sub: argparse._SubParsersAction) -> None:
     diff_parser = sub.add_parser("diff", help="Semantic diff between two model files")
     diff_parser.add_argument("old", help="Old model YAML path")
     diff_parser.add_argument("new", help="New model YAML path")
+    diff_parser.add_argument("--no-cache", action="store_true", help="Bypass the on-disk model parse cache")
     diff_parser.set_defaults(func=cmd_diff)
 
+
+def _register_validate_all(sub: argparse._SubParsersAction) -> None:
     validate_all_parser = sub.add_parser(
         "validate-all", help="Validate all model files matching a glob"
     )
@@ -3479,6 +3205,8 @@ def build_parser() -> argparse.ArgumentParser:
     )
     validate_all_parser.set_defaults(func=cmd_validate_all)
 
+
+def _register_gate(sub: argparse._SubParsersAction) -> None:
     gate_parser = sub.add_parser(
         "gate",
         help="PR gate: validate old/new models and fail on breaking changes by default",
@@ -3496,8 +3224,11 @@ def build_parser() -> argparse.ArgumentParser:
     gate_parser.add_argument(
         "--output-json", action="store_true", help="Print semantic diff as JSON"
     )
+    gate_parser.add_argument("--no-cache", action="store_true", help="Bypass the on-disk model parse cache")
     gate_parser.set_defaults(func=cmd_gate)
 
+
+def _register_readiness_gate(sub: argparse._SubParsersAction) -> None:
     readiness_gate_parser = sub.add_parser(
         "readiness-gate",
         help="CI/CD gate: run the dbt-readiness engine and fail on red/score thresholds",
@@ -3540,6 +3271,8 @@ def build_parser() -> argparse.ArgumentParser:
     )
     readiness_gate_parser.set_defaults(func=cmd_readiness_gate)
 
+
+def _register_policy_check(sub: argparse._SubParsersAction) -> None:
     policy_parser = sub.add_parser("policy-check", help="Evaluate a model against a policy pack")
     policy_parser.add_argument("model", help="Path to model YAML")
     # `--policy` may be passed multiple times to merge several packs (e.g.
@@ -3564,6 +3297,8 @@ def build_parser() -> argparse.ArgumentParser:
     policy_parser.add_argument("--inherit", action="store_true", help="Resolve pack.extends inheritance chain before evaluation")
     policy_parser.set_defaults(func=cmd_policy_check)
 
+
+def _register_generate(sub: argparse._SubParsersAction) -> None:
     generate_parser = sub.add_parser("generate", help="Generate artifacts from model YAML")
     generate_sub = generate_parser.add_subparsers(dest="generate_command", required=True)
 
@@ -3599,8 +3334,11 @@ def build_parser() -> argparse.ArgumentParser:
     gen_changelog_parser.add_argument("old", help="Old model YAML path")
     gen_changelog_parser.add_argument("new", help="New model YAML path")
     gen_changelog_parser.add_argument("--out", help="Output changelog file path")
+    gen_changelog_parser.add_argument("--no-cache", action="store_true", help="Bypass the on-disk model parse cache")
     gen_changelog_parser.set_defaults(func=cmd_generate_changelog)
 
+
+def _register_import(sub: argparse._SubParsersAction) -> None:
     import_parser = sub.add_parser("import", help="Import SQL/DBML/Spark/dbt schema into model YAML")
     import_sub = import_parser.add_subparsers(dest="import_command", required=True)
 
@@ -3651,6 +3389,8 @@ def build_parser() -> argparse.ArgumentParser:
     import_dbt_parser.add_argument("--schema", default=_default_schema_path(), help="Path to model schema JSON")
     import_dbt_parser.set_defaults(func=cmd_import_dbt)
 
+
+def _register_draft(sub: argparse._SubParsersAction) -> None:
     draft_parser = sub.add_parser(
         "draft",
         help="AI-assisted DataLex starter from a dbt project",
@@ -3713,6 +3453,8 @@ def build_parser() -> argparse.ArgumentParser:
     )
     draft_parser.set_defaults(func=cmd_draft)
 
+
+def _register_dbt(sub: argparse._SubParsersAction) -> None:
     # dbt round-trip subcommand group
     dbt_parser = sub.add_parser("dbt", help="dbt round-trip: sync DataLex metadata into dbt schema.yml files")
     dbt_sub = dbt_parser.add_subparsers(dest="dbt_command", required=True)
@@ -3769,6 +3511,28 @@ def build_parser() -> argparse.ArgumentParser:
     )
     dbt_import_parser.set_defaults(func=cmd_dbt_import)
 
+    dbt_docs_parser = dbt_sub.add_parser(
+        "docs",
+        help="Inspect and reindex the doc-block index for a dbt project",
+    )
+    dbt_docs_sub = dbt_docs_parser.add_subparsers(dest="dbt_docs_command", required=True)
+    dbt_docs_reindex = dbt_docs_sub.add_parser(
+        "reindex",
+        # `%` must be escaped as `%%` in argparse help strings — Python 3.14's
+        # stricter argparse validator reads `% d` as a `%d` conversion and
+        # rejects the parser at build time.
+        help="Rebuild the {%% docs %%} block index and print resolved names",
+    )
+    dbt_docs_reindex.add_argument(
+        "--project-dir",
+        required=True,
+        help="Path to the dbt project root",
+    )
+    dbt_docs_reindex.add_argument("--json", action="store_true", help="Emit JSON instead of a summary")
+    dbt_docs_reindex.set_defaults(func=cmd_dbt_docs_reindex)
+
+
+def _register_emit(sub: argparse._SubParsersAction) -> None:
     emit_parser = sub.add_parser(
         "emit",
         help="Emit DataLex artifacts for external systems",
@@ -3790,26 +3554,8 @@ def build_parser() -> argparse.ArgumentParser:
     )
     emit_catalog_parser.set_defaults(func=cmd_emit_catalog)
 
-    dbt_docs_parser = dbt_sub.add_parser(
-        "docs",
-        help="Inspect and reindex the doc-block index for a dbt project",
-    )
-    dbt_docs_sub = dbt_docs_parser.add_subparsers(dest="dbt_docs_command", required=True)
-    dbt_docs_reindex = dbt_docs_sub.add_parser(
-        "reindex",
-        # `%` must be escaped as `%%` in argparse help strings — Python 3.14's
-        # stricter argparse validator reads `% d` as a `%d` conversion and
-        # rejects the parser at build time.
-        help="Rebuild the {%% docs %%} block index and print resolved names",
-    )
-    dbt_docs_reindex.add_argument(
-        "--project-dir",
-        required=True,
-        help="Path to the dbt project root",
-    )
-    dbt_docs_reindex.add_argument("--json", action="store_true", help="Emit JSON instead of a summary")
-    dbt_docs_reindex.set_defaults(func=cmd_dbt_docs_reindex)
 
+def _register_docs(sub: argparse._SubParsersAction) -> None:
     # ─── Project-wide docs export ─────────────────────────────────────────
     docs_parser = sub.add_parser("docs", help="Project-wide documentation tools")
     docs_sub = docs_parser.add_subparsers(dest="docs_command", required=True)
@@ -3822,12 +3568,15 @@ def build_parser() -> argparse.ArgumentParser:
     docs_export.add_argument("--json", action="store_true", help="Emit JSON summary on stdout")
     docs_export.set_defaults(func=cmd_docs_export)
 
+
+def _register_pull(sub: argparse._SubParsersAction) -> None:
     pull_parser = sub.add_parser("pull", help="Pull schema from a live database into a DataLex model")
     pull_parser.add_argument("connector", help="Connector type (postgres, mysql, snowflake, bigquery, databricks, sqlserver, azure_sql, azure_fabric, redshift)")
     pull_parser.add_argument("--host", help="Database host (or Snowflake account, Databricks server hostname)")
     pull_parser.add_argument("--port", type=int, help="Database port")
     pull_parser.add_argument("--database", help="Database name")
     pull_parser.add_argument("--db-schema", help="Schema name (default: public/PUBLIC/default)")
+    pull_parser.add_argument("--schemas", nargs="*", help="Pull several schemas concurrently and merge into one model (Snowflake; pass no names to pull every schema)")
     pull_parser.add_argument("--user", help="Database user")
     pull_parser.add_argument("--password", help="Database password")
     pull_parser.add_argument("--warehouse", help="Snowflake warehouse")
@@ -3868,39 +3617,26 @@ def build_parser() -> argparse.ArgumentParser:
     )
     pull_parser.set_defaults(func=cmd_pull)
 
+
+def _register_connectors(sub: argparse._SubParsersAction) -> None:
     connectors_parser = sub.add_parser("connectors", help="List available database connectors and driver status")
     connectors_parser.add_argument("--output-json", action="store_true", help="Print as JSON")
     connectors_parser.set_defaults(func=cmd_connectors)
 
-    # Common connection args helper
-    def _add_conn_args(p):
-        p.add_argument("connector", help="Connector type (postgres, mysql, snowflake, bigquery, databricks, sqlserver, azure_sql, azure_fabric, redshift)")
-        p.add_argument("--host", help="Database host")
-        p.add_argument("--port", type=int, help="Database port")
-        p.add_argument("--database", help="Database name")
-        p.add_argument("--db-schema", help="Schema name")
-        p.add_argument("--user", help="Database user")
-        p.add_argument("--password", help="Database password")
-        p.add_argument("--warehouse", help="Snowflake warehouse")
-        p.add_argument("--project", help="BigQuery project ID")
-        p.add_argument("--dataset", help="BigQuery dataset")
-        p.add_argument("--catalog", help="Databricks catalog")
-        p.add_argument("--token", help="Access token")
-        p.add_argument("--http-path", help="Databricks SQL Warehouse/Cluster HTTP path")
-        p.add_argument("--odbc-driver", help="ODBC driver for SQL Server-family connectors")
-        p.add_argument("--encrypt", help="SQL Server encryption setting (yes/no)")
-        p.add_argument("--trust-server-certificate", help="SQL Server TrustServerCertificate setting (yes/no)")
-        p.add_argument("--private-key-path", help="Path to RSA private key PEM file (Snowflake key-pair auth)")
-        p.add_argument("--output-json", action="store_true", help="Print as JSON")
 
+def _register_schemas(sub: argparse._SubParsersAction) -> None:
     schemas_parser = sub.add_parser("schemas", help="List schemas/datasets in a database")
     _add_conn_args(schemas_parser)
     schemas_parser.set_defaults(func=cmd_schemas)
 
+
+def _register_tables(sub: argparse._SubParsersAction) -> None:
     tables_parser = sub.add_parser("tables", help="List tables in a database schema")
     _add_conn_args(tables_parser)
     tables_parser.set_defaults(func=cmd_tables)
 
+
+def _register_resolve(sub: argparse._SubParsersAction) -> None:
     resolve_parser = sub.add_parser("resolve", help="Resolve cross-model imports and show unified graph")
     resolve_parser.add_argument("model", help="Path to root model YAML")
     resolve_parser.add_argument(
@@ -3912,6 +3648,8 @@ def build_parser() -> argparse.ArgumentParser:
     resolve_parser.add_argument("--output-json", action="store_true", help="Print graph as JSON")
     resolve_parser.set_defaults(func=cmd_resolve)
 
+
+def _register_resolve_project(sub: argparse._SubParsersAction) -> None:
     resolve_project_parser = sub.add_parser("resolve-project", help="Resolve all models in a project directory")
     resolve_project_parser.add_argument("directory", help="Project directory path")
     resolve_project_parser.add_argument(
@@ -3923,6 +3661,8 @@ def build_parser() -> argparse.ArgumentParser:
     resolve_project_parser.add_argument("--output-json", action="store_true", help="Print results as JSON")
     resolve_project_parser.set_defaults(func=cmd_resolve_project)
 
+
+def _register_diff_all(sub: argparse._SubParsersAction) -> None:
     diff_all_parser = sub.add_parser("diff-all", help="Semantic diff between two model directories")
     diff_all_parser.add_argument("old", help="Old model directory")
     diff_all_parser.add_argument("new", help="New model directory")
@@ -3934,6 +3674,8 @@ def build_parser() -> argparse.ArgumentParser:
     )
     diff_all_parser.set_defaults(func=cmd_diff_all)
 
+
+def _register_transform(sub: argparse._SubParsersAction) -> None:
     transform_parser = sub.add_parser("transform", help="Transform a model between conceptual, logical, and physical forms")
     transform_sub = transform_parser.add_subparsers(dest="transform_command", required=True)
 
@@ -3950,6 +3692,8 @@ def build_parser() -> argparse.ArgumentParser:
     transform_to_physical.add_argument("--out", help="Write transformed model YAML")
     transform_to_physical.set_defaults(func=cmd_transform)
 
+
+def _register_standards(sub: argparse._SubParsersAction) -> None:
     standards_parser = sub.add_parser("standards", help="Check or autofix model standards, naming rules, and shared libraries")
     standards_sub = standards_parser.add_subparsers(dest="standards_command", required=True)
 
@@ -3965,6 +3709,8 @@ def build_parser() -> argparse.ArgumentParser:
     standards_fix.add_argument("--out", help="Write fixed YAML to a new path")
     standards_fix.set_defaults(func=cmd_standards_fix)
 
+
+def _register_sync(sub: argparse._SubParsersAction) -> None:
     sync_parser = sub.add_parser("sync", help="Round-trip compare, merge, or pull workflows")
     sync_sub = sync_parser.add_subparsers(dest="sync_command", required=True)
 
@@ -4009,17 +3755,31 @@ def build_parser() -> argparse.ArgumentParser:
     sync_pull.add_argument("--test", action="store_true", help="Test connection only, do not pull schema")
     sync_pull.set_defaults(func=cmd_sync_pull)
 
+
+def _register_fmt(sub: argparse._SubParsersAction) -> None:
     fmt_parser = sub.add_parser("fmt", help="Auto-format YAML model to canonical style")
     fmt_parser.add_argument("model", help="Path to model YAML")
     fmt_parser.add_argument("--write", "-w", action="store_true", help="Overwrite the input file in-place")
     fmt_parser.add_argument("--out", help="Output file path (alternative to --write)")
+    fmt_parser.add_argument(
+        "--style",
+        choices=["fast", "round-trip"],
+        default="fast",
+        help="Emitter: 'fast' uses the libyaml C dumper; 'round-trip' uses "
+        "ruamel.yaml for style-preserving output (slower, needs ruamel.yaml "
+        "installed, falls back to fast otherwise)",
+    )
     fmt_parser.set_defaults(func=cmd_fmt)
 
+
+def _register_stats(sub: argparse._SubParsersAction) -> None:
     stats_parser = sub.add_parser("stats", help="Print model statistics")
     stats_parser.add_argument("model", help="Path to model YAML")
     stats_parser.add_argument("--output-json", action="store_true", help="Print stats as JSON")
     stats_parser.set_defaults(func=cmd_stats)
 
+
+def _register_completeness(sub: argparse._SubParsersAction) -> None:
     completeness_parser = sub.add_parser(
         "completeness",
         help="Score each entity against single-source-of-truth completeness dimensions",
@@ -4040,10 +3800,14 @@ def build_parser() -> argparse.ArgumentParser:
     )
     completeness_parser.set_defaults(func=cmd_completeness)
 
+
+def _register_print_schema(sub: argparse._SubParsersAction) -> None:
     schema_parser = sub.add_parser("print-schema", help="Print active model schema JSON")
     schema_parser.add_argument("--schema", default=_default_schema_path(), help="Path to JSON schema")
     schema_parser.set_defaults(func=cmd_schema)
 
+
+def _register_print_policy_schema(sub: argparse._SubParsersAction) -> None:
     policy_schema_parser = sub.add_parser("print-policy-schema", help="Print policy schema JSON")
     policy_schema_parser.add_argument(
         "--policy-schema",
@@ -4052,11 +3816,15 @@ def build_parser() -> argparse.ArgumentParser:
     )
     policy_schema_parser.set_defaults(func=cmd_policy_schema)
 
+
+def _register_doctor(sub: argparse._SubParsersAction) -> None:
     doctor_parser = sub.add_parser("doctor", help="Diagnose project setup issues")
     doctor_parser.add_argument("--path", default=".", help="Project directory to diagnose")
     doctor_parser.add_argument("--output-json", action="store_true", help="Print diagnostics as JSON")
     doctor_parser.set_defaults(func=cmd_doctor)
 
+
+def _register_migrate(sub: argparse._SubParsersAction) -> None:
     migrate_parser = sub.add_parser("migrate", help="Generate SQL migration between two model versions")
     migrate_parser.add_argument("old", help="Old model YAML path")
     migrate_parser.add_argument("new", help="New model YAML path")
@@ -4064,6 +3832,8 @@ def build_parser() -> argparse.ArgumentParser:
     migrate_parser.add_argument("--out", help="Output SQL migration file path")
     migrate_parser.set_defaults(func=cmd_migrate)
 
+
+def _register_apply(sub: argparse._SubParsersAction) -> None:
     apply_parser = sub.add_parser("apply", help="Apply SQL/migration to a live database")
     apply_parser.add_argument("connector", choices=["snowflake", "databricks", "bigquery"], help="Target connector")
     apply_parser.add_argument("--dialect", default=None, choices=["snowflake", "bigquery", "databricks"], help="SQL dialect (defaults to connector)")
@@ -4096,10 +3866,14 @@ def build_parser() -> argparse.ArgumentParser:
     apply_parser.add_argument("--dry-run", action="store_true", help="Print SQL and exit without execution")
     apply_parser.set_defaults(func=cmd_apply)
 
+
+def _register_completion(sub: argparse._SubParsersAction) -> None:
     completion_parser = sub.add_parser("completion", help="Generate shell completion script")
     completion_parser.add_argument("shell", choices=["bash", "zsh", "fish"], help="Shell type")
     completion_parser.set_defaults(func=cmd_completion)
 
+
+def _register_upgrade(sub: argparse._SubParsersAction) -> None:
     upgrade_parser = sub.add_parser(
         "upgrade",
         help="Upgrade datalex-cli to the latest PyPI release",
@@ -4110,20 +3884,99 @@ def build_parser() -> argparse.ArgumentParser:
     )
     upgrade_parser.set_defaults(func=cmd_upgrade)
 
+
+def _register_watch(sub: argparse._SubParsersAction) -> None:
     watch_parser = sub.add_parser("watch", help="Watch model files and validate on change")
     watch_parser.add_argument("--glob", default="**/*.model.yaml", help="Glob pattern for model files")
     watch_parser.add_argument("--interval", type=int, default=2, help="Poll interval in seconds")
     watch_parser.add_argument("--schema", default=_default_schema_path(), help="Path to JSON schema")
     watch_parser.set_defaults(func=cmd_watch)
 
+
+def _register_datalex(sub: argparse._SubParsersAction) -> None:
     from datalex_cli.datalex_cli import register_datalex
     register_datalex(sub)
 
+
+_REGISTRARS = {
+    "serve": _register_serve,
+    "init": _register_init,
+    "validate": _register_validate,
+    "lint": _register_lint,
+    "compile": _register_compile,
+    "diff": _register_diff,
+    "validate-all": _register_validate_all,
+    "gate": _register_gate,
+    "readiness-gate": _register_readiness_gate,
+    "policy-check": _register_policy_check,
+    "generate": _register_generate,
+    "import": _register_import,
+    "draft": _register_draft,
+    "dbt": _register_dbt,
+    "emit": _register_emit,
+    "docs": _register_docs,
+    "pull": _register_pull,
+    "connectors": _register_connectors,
+    "schemas": _register_schemas,
+    "tables": _register_tables,
+    "resolve": _register_resolve,
+    "resolve-project": _register_resolve_project,
+    "diff-all": _register_diff_all,
+    "transform": _register_transform,
+    "standards": _register_standards,
+    "sync": _register_sync,
+    "fmt": _register_fmt,
+    "stats": _register_stats,
+    "completeness": _register_completeness,
+    "print-schema": _register_print_schema,
+    "print-policy-schema": _register_print_policy_schema,
+    "doctor": _register_doctor,
+    "migrate": _register_migrate,
+    "apply": _register_apply,
+    "completion": _register_completion,
+    "upgrade": _register_upgrade,
+    "watch": _register_watch,
+    "datalex": _register_datalex,
+}
+
+
+@lru_cache(maxsize=4)
+def build_parser(only: str = "") -> argparse.ArgumentParser:
+    """Build the CLI parser.
+
+    Memoized: a process invoking the CLI repeatedly (test harnesses, batch
+    wrappers driving main() in a loop) reuses the parser tree instead of
+    rebuilding ~38 subparsers per call. Registration has no side effects, so
+    reuse is safe; use build_parser.cache_clear() if a test needs isolation.
+
+    When *only* names a known command, just that command's subparser is
+    constructed — building all of them costs tens of milliseconds of
+    startup, which dominates `datalex` invocations in per-file CI loops.
+    Any other value (empty, --help, a typo) falls back to the full parser
+    so help listings and error messages still cover every command.
+    """
+    parser = argparse.ArgumentParser(prog="datalex", description="DataLex CLI")
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=f"%(prog)s {_cli_version()}",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    if only in _REGISTRARS:
+        _REGISTRARS[only](sub)
+    else:
+        for register in _REGISTRARS.values():
+            register(sub)
+
     return parser
 
 
 def main() -> int:
-    parser = build_parser()
+    # Peek at the command token so build_parser only constructs the one
+    # subparser this invocation needs; anything unrecognized (flags, typos,
+    # no args) gets the full parser for proper help and error output.
+    parser = build_parser(sys.argv[1] if len(sys.argv) > 1 else "")
     args = parser.parse_args()
     # Non-blocking "newer version on PyPI" notice (skipped for `upgrade`,
     # which does its own check, and self-silenced in CI / dev installs).
@@ -1,55 +1,86 @@
-from datalex_core.canonical import compile_model
-from datalex_core.diffing import project_diff, semantic_diff
-from datalex_core.docs_generator import (
-    generate_changelog,
-    generate_html_docs,
-    generate_markdown_docs,
-    write_changelog,
-    write_html_docs,
-    write_markdown_docs,
-)
-from datalex_core.completion import generate_bash_completion, generate_fish_completion, generate_zsh_completion
-from datalex_core.doctor import diagnostics_as_json, format_diagnostics, run_diagnostics
-from datalex_core.generators import dbt_scaffold_files, generate_sql_ddl, write_dbt_scaffold
-from datalex_core.migrate import generate_migration, write_migration
-from datalex_core.mesh import interface_enabled, interface_metadata, mesh_issues, mesh_report
-from datalex_core.modeling import (
-    apply_standards_fixes,
-    merge_models_preserving_docs,
-    normalize_model,
-    standards_issues,
-    transform_model,
-)
-from datalex_core.importers import (
-    import_dbt_schema_yml,
-    import_dbml,
-    import_spark_schema,
-    import_sql_ddl,
-    sync_dbt_schema_yml,
-)
-from datalex_core.connectors.base import ConnectorConfig, ConnectorResult, get_connector, list_connectors
-from datalex_core.loader import load_yaml_model
-from datalex_core.policy import (
-    load_policy_pack,
-    load_policy_pack_with_inheritance,
-    merge_policy_packs,
-    policy_issues,
-)
-from datalex_core.resolver import resolve_model, resolve_project
-from datalex_core.schema import load_schema, schema_issues
-from datalex_core.semantic import (
-    completeness_as_dict,
-    completeness_report,
-    lint_issues,
-    EntityCompleteness,
-    ModelCompleteness,
-)
-from datalex_core.draft import (
-    DraftError,
-    condense_manifest,
-    draft_starter,
-    load_manifest,
-)
+"""datalex_core public API.
+
+Symbols are re-exported lazily (PEP 562): each submodule is imported on
+first attribute access, so consumers that only need load_yaml_model don't
+pay for jsonschema, the generators, or the connector registry at import
+time.
+"""
+
+from importlib import import_module
+from typing import Any
+
+_LAZY = {
+    "compile_model": "datalex_core.canonical",
+    "generate_bash_completion": "datalex_core.completion",
+    "generate_fish_completion": "datalex_core.completion",
+    "generate_zsh_completion": "datalex_core.completion",
+    "ConnectorConfig": "datalex_core.connectors.base",
+    "ConnectorResult": "datalex_core.connectors.base",
+    "get_connector": "datalex_core.connectors.base",
+    "list_connectors": "datalex_core.connectors.base",
+    "project_diff": "datalex_core.diffing",
+    "semantic_diff": "datalex_core.diffing",
+    "generate_changelog": "datalex_core.docs_generator",
+    "generate_html_docs": "datalex_core.docs_generator",
+    "generate_markdown_docs": "datalex_core.docs_generator",
+    "write_changelog": "datalex_core.docs_generator",
+    "write_html_docs": "datalex_core.docs_generator",
+    "write_markdown_docs": "datalex_core.docs_generator",
+    "diagnostics_as_json": "datalex_core.doctor",
+    "format_diagnostics": "datalex_core.doctor",
+    "run_diagnostics": "datalex_core.doctor",
+    "DraftError": "datalex_core.draft",
+    "condense_manifest": "datalex_core.draft",
+    "draft_starter": "datalex_core.draft",
+    "load_manifest": "datalex_core.draft",
+    "dbt_scaffold_files": "datalex_core.generators",
+    "generate_sql_ddl": "datalex_core.generators",
+    "write_dbt_scaffold": "datalex_core.generators",
+    "import_dbml": "datalex_core.importers",
+    "import_dbt_schema_yml": "datalex_core.importers",
+    "import_spark_schema": "datalex_core.importers",
+    "import_sql_ddl": "datalex_core.importers",
+    "sync_dbt_schema_yml": "datalex_core.importers",
+    "load_yaml_model": "datalex_core.loader",
+    "interface_enabled": "datalex_core.mesh",
+    "interface_metadata": "datalex_core.mesh",
+    "mesh_issues": "datalex_core.mesh",
+    "mesh_report": "datalex_core.mesh",
+    "generate_migration": "datalex_core.migrate",
+    "write_migration": "datalex_core.migrate",
+    "apply_standards_fixes": "datalex_core.modeling",
+    "merge_models_preserving_docs": "datalex_core.modeling",
+    "normalize_model": "datalex_core.modeling",
+    "standards_issues": "datalex_core.modeling",
+    "transform_model": "datalex_core.modeling",
+    "load_policy_pack": "datalex_core.policy",
+    "load_policy_pack_with_inheritance": "datalex_core.policy",
+    "merge_policy_packs": "datalex_core.policy",
+    "policy_issues": "datalex_core.policy",
+    "resolve_model": "datalex_core.resolver",
+    "resolve_project": "datalex_core.resolver",
+    "load_schema": "datalex_core.schema",
+    "schema_issues": "datalex_core.schema",
+    "EntityCompleteness": "datalex_core.semantic",
+    "ModelCompleteness": "datalex_core.semantic",
+    "completeness_as_dict": "datalex_core.semantic",
+    "completeness_report": "datalex_core.semantic",
+    "lint_issues": "datalex_core.semantic",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     "compile_model",
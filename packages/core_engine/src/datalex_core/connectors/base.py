@@ -3,13 +3,24 @@
 from __future__ import annotations
 
 import re
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import date
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
+# slots=True drops the per-instance __dict__ (ConnectorConfig has ~17 fields)
+# and makes attribute reads fixed-offset; it needs Python 3.10, so older
+# interpreters just get the plain dataclass.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# Compiled once — re.sub/re.split would otherwise consult the small shared
+# regex cache on every call, thousands of times per bulk pull.
+_NON_ALNUM = re.compile(r"[^A-Za-z0-9]+")
+
+
+@dataclass(**_SLOTS)
 class ConnectorConfig:
     """Configuration for a database connector."""
 
@@ -38,7 +49,7 @@ class ConnectorConfig:
         return self.owners or ["data-team@example.com"]
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ConnectorResult:
     """Result of a schema pull operation."""
 
@@ -63,14 +74,16 @@ class ConnectorResult:
         return "\n".join(lines)
 
 
+@lru_cache(maxsize=4096)
 def _to_pascal(name: str) -> str:
-    name = name.replace('"', "")
-    parts = re.split(r"[^A-Za-z0-9]+", name)
+    # Memoized: _entity_name is called for the same table names again in the
+    # PK/FK handlers of every connector's _pull.
+    parts = _NON_ALNUM.split(name.replace('"', ""))
     return "".join(part[:1].upper() + part[1:] for part in parts if part)
 
 
 def _to_model_name(text: str) -> str:
-    cleaned = re.sub(r"[^a-zA-Z0-9]+", "_", text).strip("_").lower()
+    cleaned = _NON_ALNUM.sub("_", text).strip("_").lower()
     return cleaned or "imported_model"
 
 
@@ -331,15 +344,32 @@ class BaseConnector(ABC):
         """
         return []
 
-    def check_driver(self) -> Tuple[bool, str]:
-        """Check if the required Python driver package is installed."""
+    def check_driver(self, deep: bool = False) -> Tuple[bool, str]:
+        """Check if the required Python driver package is installed.
+
+        The default probe uses find_spec, which locates the package without
+        executing it — importing heavyweight drivers (snowflake.connector,
+        google.cloud.bigquery) just to render a status table is what made
+        `datalex connectors` slow. Pass deep=True to actually import and
+        verify the driver loads.
+        """
         if not self.required_package:
             return True, "No driver required"
+        if deep:
+            try:
+                __import__(self.required_package)
+                return True, f"{self.required_package} is installed"
+            except ImportError:
+                return False, f"Missing driver: pip install {self.required_package}"
+        import importlib.util
+
         try:
-            __import__(self.required_package)
-            return True, f"{self.required_package} is installed"
-        except ImportError:
+            spec = importlib.util.find_spec(self.required_package)
+        except (ImportError, ValueError):
+            spec = None
+        if spec is None:
             return False, f"Missing driver: pip install {self.required_package}"
+        return True, f"{self.required_package} is installed"
 
     def _build_model(self, config: ConnectorConfig) -> Dict[str, Any]:
         return _default_model(
@@ -363,22 +393,39 @@ class BaseConnector(ABC):
 # Connector registry
 # ---------------------------------------------------------------------------
 
-_REGISTRY: Dict[str, BaseConnector] = {}
+# Values are either live BaseConnector instances or "module:ClassName"
+# import strings; strings are resolved (and replaced with an instance) on
+# first use, so importing this module doesn't import nine connector modules.
+_REGISTRY: Dict[str, Any] = {}
 
 
 def _register(connector: BaseConnector) -> None:
     _REGISTRY[connector.connector_type] = connector
 
 
+def _resolve(entry: Any) -> BaseConnector:
+    if isinstance(entry, str):
+        import importlib
+
+        module_name, class_name = entry.split(":")
+        entry = getattr(importlib.import_module(module_name), class_name)()
+        _REGISTRY[entry.connector_type] = entry
+    return entry
+
+
 def get_connector(connector_type: str) -> Optional[BaseConnector]:
     """Get a connector by type name."""
-    return _REGISTRY.get(connector_type)
+    entry = _REGISTRY.get(connector_type)
+    if entry is None:
+        return None
+    return _resolve(entry)
 
 
 def list_connectors() -> List[Dict[str, str]]:
     """List all registered connectors."""
     result = []
-    for name, conn in sorted(_REGISTRY.items()):
+    for name in sorted(_REGISTRY):
+        conn = _resolve(_REGISTRY[name])
         ok, msg = conn.check_driver()
         result.append({
             "type": name,
@@ -391,27 +438,19 @@ def list_connectors() -> List[Dict[str, str]]:
 
 
 def register_all() -> None:
-    """Register all built-in connectors."""
-    from datalex_core.connectors.postgres import PostgresConnector
-    from datalex_core.connectors.mysql import MySQLConnector
-    from datalex_core.connectors.snowflake import SnowflakeConnector
-    from datalex_core.connectors.bigquery import BigQueryConnector
-    from datalex_core.connectors.databricks import DatabricksConnector
-    from datalex_core.connectors.sqlserver import SQLServerConnector, AzureSQLConnector, AzureFabricConnector
-    from datalex_core.connectors.redshift import RedshiftConnector
-
-    for cls in [
-        PostgresConnector,
-        MySQLConnector,
-        SnowflakeConnector,
-        BigQueryConnector,
-        DatabricksConnector,
-        SQLServerConnector,
-        AzureSQLConnector,
-        AzureFabricConnector,
-        RedshiftConnector,
-    ]:
-        _register(cls())
+    """Register all built-in connectors (lazily, as import strings)."""
+    _prefix = "datalex_core.connectors"
+    _REGISTRY.update({
+        "postgres": f"{_prefix}.postgres:PostgresConnector",
+        "mysql": f"{_prefix}.mysql:MySQLConnector",
+        "snowflake": f"{_prefix}.snowflake:SnowflakeConnector",
+        "bigquery": f"{_prefix}.bigquery:BigQueryConnector",
+        "databricks": f"{_prefix}.databricks:DatabricksConnector",
+        "sqlserver": f"{_prefix}.sqlserver:SQLServerConnector",
+        "azure_sql": f"{_prefix}.sqlserver:AzureSQLConnector",
+        "azure_fabric": f"{_prefix}.sqlserver:AzureFabricConnector",
+        "redshift": f"{_prefix}.redshift:RedshiftConnector",
+    })
 
 
 register_all()
@@ -3,9 +3,8 @@
 from __future__ import annotations
 
 import os
+import sys
 import warnings
-warnings.filterwarnings("ignore", message=".*incompatible version of 'pyarrow'.*")
-
 from datetime import date
 from typing import Any, Dict, List, Tuple
 
@@ -100,6 +99,54 @@ _SF_TYPE_MAP = {
     "GEOMETRY": "string",
 }
 
+_SF_DECIMAL_TYPES = frozenset({"NUMBER", "DECIMAL", "NUMERIC"})
+
+
+def _import_driver():
+    """Import snowflake.connector with its pyarrow-version warning silenced.
+
+    The filter is scoped to the import via catch_warnings rather than added
+    to the global filter list at module import time — every warnings.warn in
+    the process walks that list, and mutating it as an import side effect
+    hurts test reproducibility.
+    """
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message=".*incompatible version of 'pyarrow'.*")
+        import snowflake.connector
+
+    return snowflake
+
+_COLUMN_FIELDS = (
+    "TABLE_NAME", "COLUMN_NAME", "DATA_TYPE", "IS_NULLABLE",
+    "COLUMN_DEFAULT", "CHARACTER_MAXIMUM_LENGTH",
+    "NUMERIC_PRECISION", "NUMERIC_SCALE",
+)
+
+
+def _iter_column_rows(cur: Any):
+    """Yield column rows from the cursor, preferring Arrow batches.
+
+    fetch_arrow_batches keeps results in columnar buffers instead of one
+    Python tuple (and eight boxed values) per row, which matters on schemas
+    with 100k+ columns. Falls back to chunked tuple fetches when pyarrow or
+    the connector's Arrow support is unavailable.
+    """
+    try:
+        batches = cur.fetch_arrow_batches()
+    except Exception:
+        batches = None
+
+    if batches is not None:
+        for batch in batches:
+            yield from zip(*(batch.column(name).to_pylist() for name in _COLUMN_FIELDS))
+        return
+
+    while True:
+        rows = cur.fetchmany(10_000)
+        if not rows:
+            return
+        yield from rows
+
 
 class SnowflakeConnector(BaseConnector):
     connector_type = "snowflake"
@@ -125,7 +172,7 @@ class SnowflakeConnector(BaseConnector):
 
     def test_connection(self, config: ConnectorConfig) -> Tuple[bool, str]:
         try:
-            import snowflake.connector
+            snowflake = _import_driver()
             conn = snowflake.connector.connect(**self._build_connect_params(config))
             conn.close()
             return True, "Connection successful"
@@ -137,7 +184,7 @@ class SnowflakeConnector(BaseConnector):
             return False, f"Connection failed: {e}"
 
     def _connect(self, config: ConnectorConfig):
-        import snowflake.connector
+        snowflake = _import_driver()
         conn = snowflake.connector.connect(**self._build_connect_params(config))
         # Auto-resume the warehouse if it is suspended
         if config.warehouse:
@@ -198,6 +245,38 @@ class SnowflakeConnector(BaseConnector):
         finally:
             conn.close()
 
+    def pull_all(self, config: ConnectorConfig, schemas: List[str] | None = None) -> ConnectorResult:
+        """Pull every schema of the database concurrently and merge the results.
+
+        Each pull is dominated by server round-trips, during which the driver
+        releases the GIL, so one thread (and one connection) per schema
+        overlaps the latency instead of paying it serially.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        from dataclasses import replace
+
+        if schemas is None:
+            schemas = [item["name"] for item in self.list_schemas(config)]
+        if not schemas:
+            return ConnectorResult(model=self._build_model(config))
+
+        def _one(schema_name: str) -> ConnectorResult:
+            return self.pull_schema(replace(config, schema=schema_name))
+
+        with ThreadPoolExecutor(max_workers=min(8, len(schemas))) as executor:
+            results = list(executor.map(_one, schemas))
+
+        merged = results[0]
+        for result in results[1:]:
+            merged.model.setdefault("entities", []).extend(result.model.get("entities", []))
+            merged.model.setdefault("relationships", []).extend(result.model.get("relationships", []))
+            merged.tables_found += result.tables_found
+            merged.columns_found += result.columns_found
+            merged.relationships_found += result.relationships_found
+            merged.indexes_found += result.indexes_found
+            merged.warnings.extend(result.warnings)
+        return merged
+
     def _pull(self, conn: Any, config: ConnectorConfig) -> ConnectorResult:
         model = self._build_model(config)
         schema_filter = (config.schema or "PUBLIC").upper()
@@ -209,16 +288,31 @@ class SnowflakeConnector(BaseConnector):
         cur.execute(f"""
             SELECT TABLE_NAME, TABLE_TYPE
             FROM {db_name}.INFORMATION_SCHEMA.TABLES
-            WHERE TABLE_SCHEMA = '{schema_filter}'
+            WHERE TABLE_SCHEMA = %s
               AND TABLE_TYPE IN ('BASE TABLE', 'VIEW')
             ORDER BY TABLE_NAME
-        """)
+        """, (schema_filter,))
         tables = cur.fetchall()
 
+        # Hoist the include/exclude decision out of the per-table loop: the
+        # common case is no filter at all, and when one is set, set membership
+        # beats scanning the configured lists for every table.
+        include = set(config.tables) if config.tables else None
+        exclude = set(config.exclude_tables) if config.exclude_tables else None
+        filtered = include is not None or exclude is not None
+
+        # Table and column names are the join keys across the tables, columns,
+        # PK, and FK result sets — interning them makes the repeated dict
+        # lookups and equality checks pointer comparisons and dedupes the
+        # many copies the driver materializes per result set.
         table_entities: Dict[str, Dict[str, Any]] = {}
         for table_name, table_type in tables:
-            if not self._should_include_table(table_name, config):
-                continue
+            table_name = sys.intern(table_name)
+            if filtered:
+                if include is not None and table_name not in include:
+                    continue
+                if exclude is not None and table_name in exclude:
+                    continue
             entity_name = self._entity_name(table_name)
             entity_type = "view" if table_type == "VIEW" else "table"
             table_entities[table_name] = {
@@ -232,28 +326,32 @@ class SnowflakeConnector(BaseConnector):
             }
 
         # --- Columns ---
+        # Bound schema parameter (keeps Snowflake's statement cache warm and
+        # closes the interpolation hole); fetchmany streaming bounds memory on
+        # schemas with hundreds of thousands of columns.
         cur.execute(f"""
             SELECT TABLE_NAME, COLUMN_NAME, DATA_TYPE, IS_NULLABLE,
                    COLUMN_DEFAULT, CHARACTER_MAXIMUM_LENGTH,
                    NUMERIC_PRECISION, NUMERIC_SCALE
             FROM {db_name}.INFORMATION_SCHEMA.COLUMNS
-            WHERE TABLE_SCHEMA = '{schema_filter}'
+            WHERE TABLE_SCHEMA = %s
             ORDER BY TABLE_NAME, ORDINAL_POSITION
-        """)
-        columns = cur.fetchall()
+        """, (schema_filter,))
         total_columns = 0
 
-        for row in columns:
+        for row in _iter_column_rows(cur):
             tname, col_name, data_type, is_nullable, col_default, char_max_len, num_prec, num_scale = row
+            tname = sys.intern(tname)
             if tname not in table_entities:
                 continue
 
-            dl_type = _SF_TYPE_MAP.get(data_type.upper(), "string")
-            if data_type.upper() in ("NUMBER", "DECIMAL", "NUMERIC") and num_prec:
+            dt_upper = data_type.upper()
+            dl_type = _SF_TYPE_MAP.get(dt_upper, "string")
+            if dt_upper in _SF_DECIMAL_TYPES and num_prec:
                 dl_type = f"decimal({num_prec},{num_scale or 0})"
 
             field: Dict[str, Any] = {
-                "name": col_name.lower(),
+                "name": sys.intern(col_name.lower()),
                 "type": dl_type,
                 "nullable": is_nullable == "YES",
             }
@@ -263,44 +361,59 @@ class SnowflakeConnector(BaseConnector):
             table_entities[tname]["fields"].append(field)
             total_columns += 1
 
+        # Per-table column index so PK/FK tagging below is an O(1) dict hit
+        # instead of a scan over every field per constraint row.
+        field_index: Dict[str, Dict[str, Dict[str, Any]]] = {
+            tname: {f["name"]: f for f in ent["fields"]}
+            for tname, ent in table_entities.items()
+        }
+
         # --- Primary keys ---
+        # One schema-level SHOW PRIMARY KEYS instead of a round-trip per
+        # table: on a 500-table schema the per-table loop meant 500 sequential
+        # network calls, and latency — not local work — dominated pull_schema.
+        # (Snowflake has no KEY_COLUMN_USAGE view, so SHOW is also the only
+        # way to get key columns at all.)
         try:
-            for tname in table_entities:
-                cur.execute(f"SHOW PRIMARY KEYS IN TABLE {db_name}.{schema_filter}.{tname}")
-                pk_rows = cur.fetchall()
-                for pk_row in pk_rows:
-                    pk_col = pk_row[4] if len(pk_row) > 4 else None
-                    if pk_col:
-                        for f in table_entities[tname]["fields"]:
-                            if f["name"] == pk_col.lower():
-                                f["primary_key"] = True
-                                f["nullable"] = False
+            cur.execute(f"SHOW PRIMARY KEYS IN SCHEMA {db_name}.{schema_filter}")
+            for pk_row in cur.fetchall():
+                tname = pk_row[3] if len(pk_row) > 3 else None
+                pk_col = pk_row[4] if len(pk_row) > 4 else None
+                if tname in table_entities and pk_col:
+                    fld = field_index[tname].get(sys.intern(pk_col.lower()))
+                    if fld is not None:
+                        fld["primary_key"] = True
+                        fld["nullable"] = False
         except Exception as e:
             warnings.append(f"Could not fetch primary keys: {e}")
 
         # --- Foreign keys ---
+        # Same batching: one SHOW IMPORTED KEYS over the schema, reading the
+        # child table from each row instead of looping over tables.
         relationships: List[Dict[str, Any]] = []
         try:
-            for tname in table_entities:
-                cur.execute(f"SHOW IMPORTED KEYS IN TABLE {db_name}.{schema_filter}.{tname}")
-                fk_rows = cur.fetchall()
-                for fk_row in fk_rows:
-                    parent_table = fk_row[2] if len(fk_row) > 2 else None
-                    parent_col = fk_row[3] if len(fk_row) > 3 else None
-                    child_col = fk_row[7] if len(fk_row) > 7 else None
-                    fk_name = fk_row[11] if len(fk_row) > 11 else None
-                    if parent_table and parent_col and child_col:
-                        for f in table_entities[tname]["fields"]:
-                            if f["name"] == child_col.lower():
-                                f["foreign_key"] = True
-                        parent_entity = self._entity_name(parent_table)
-                        child_entity = self._entity_name(tname)
-                        relationships.append({
-                            "name": fk_name or f"{parent_entity.lower()}_{child_entity.lower()}_{child_col.lower()}_fk",
-                            "from": f"{parent_entity}.{parent_col.lower()}",
-                            "to": f"{child_entity}.{child_col.lower()}",
-                            "cardinality": "one_to_many",
-                        })
+            cur.execute(f"SHOW IMPORTED KEYS IN SCHEMA {db_name}.{schema_filter}")
+            for fk_row in cur.fetchall():
+                parent_table = fk_row[2] if len(fk_row) > 2 else None
+                parent_col = fk_row[3] if len(fk_row) > 3 else None
+                tname = fk_row[6] if len(fk_row) > 6 else None
+                child_col = fk_row[7] if len(fk_row) > 7 else None
+                fk_name = fk_row[11] if len(fk_row) > 11 else None
+                if tname not in table_entities:
+                    continue
+                if parent_table and parent_col and child_col:
+                    child_col_l = sys.intern(child_col.lower())
+                    fld = field_index[tname].get(child_col_l)
+                    if fld is not None:
+                        fld["foreign_key"] = True
+                    parent_entity = self._entity_name(parent_table)
+                    child_entity = self._entity_name(tname)
+                    relationships.append({
+                        "name": fk_name or f"{parent_entity.lower()}_{child_entity.lower()}_{child_col_l}_fk",
+                        "from": f"{parent_entity}.{parent_col.lower()}",
+                        "to": f"{child_entity}.{child_col_l}",
+                        "cardinality": "one_to_many",
+                    })
         except Exception as e:
             warnings.append(f"Could not fetch foreign keys: {e}")
 
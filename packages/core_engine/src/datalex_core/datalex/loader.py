@@ -18,7 +18,7 @@ from pathlib import Path
 from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import yaml
-from jsonschema import Draft202012Validator
+from datalex_core.schema import _validator_for
 
 from datalex_core.datalex.errors import DataLexError, DataLexErrorBag, SourceLocation
 from datalex_core.datalex.parse_cache import (
@@ -155,7 +155,7 @@ def _validate_against_kind_schema(
         return
 
     clean = _strip_marks(doc)
-    validator = Draft202012Validator(schema)
+    validator = _validator_for(schema)
     for err in sorted(validator.iter_errors(clean), key=lambda e: list(e.absolute_path)):
         line, column = _lookup_mark(doc, list(err.absolute_path))
         bag.add(
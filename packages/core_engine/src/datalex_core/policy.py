@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Set
 
@@ -8,12 +9,9 @@ from datalex_core.issues import Issue
 from datalex_core.modeling import normalize_model
 
 
-def load_policy_pack(path: str) -> Dict[str, Any]:
-    policy_path = Path(path)
-    if not policy_path.exists():
-        raise FileNotFoundError(f"Policy pack not found: {path}")
-
-    with policy_path.open("r", encoding="utf-8") as handle:
+@lru_cache(maxsize=None)
+def _load_policy_pack_cached(resolved_path: str, mtime_ns: int) -> Dict[str, Any]:
+    with open(resolved_path, "r", encoding="utf-8") as handle:
         loaded = yaml.safe_load(handle)
 
     if loaded is None:
@@ -25,6 +23,16 @@ def load_policy_pack(path: str) -> Dict[str, Any]:
     return loaded
 
 
+def load_policy_pack(path: str) -> Dict[str, Any]:
+    policy_path = Path(path)
+    if not policy_path.exists():
+        raise FileNotFoundError(f"Policy pack not found: {path}")
+
+    # Memoized on (path, mtime) so repeated policy evaluations in one process
+    # re-parse a pack only when the file actually changes on disk.
+    return _load_policy_pack_cached(str(policy_path.resolve()), policy_path.stat().st_mtime_ns)
+
+
 def _policy_issue(severity: str, code: str, message: str, path: str = "/") -> Issue:
     return Issue(severity=severity, code=code, message=message, path=path)
 
@@ -11,39 +11,70 @@ Resolution strategy:
 5. Validate: no circular imports, no duplicate entity names across models.
 """
 
-import copy
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
 
 from datalex_core.issues import Issue
 from datalex_core.loader import load_yaml_model
 
 
-def _find_model_file(
+@lru_cache(maxsize=None)
+def _dir_listing(dir_path: str) -> Tuple[FrozenSet[str], Tuple[str, ...]]:
+    """Return (file names, sorted subdirectory names) for a directory.
+
+    One scandir per directory replaces a pair of exists() stats per candidate
+    file; the cache lives for the process, which suits the one-shot CLI
+    commands that drive the resolver and lets resolve_project share listings
+    across its per-file resolve_model calls.
+    """
+    files: Set[str] = set()
+    subdirs: List[str] = []
+    try:
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.name.startswith("."):
+                        subdirs.append(entry.name)
+                else:
+                    files.add(entry.name)
+    except OSError:
+        pass
+    return frozenset(files), tuple(sorted(subdirs))
+
+
+@lru_cache(maxsize=None)
+def _find_model_file_cached(
     model_name: str,
-    search_dirs: List[Path],
+    search_dirs: Tuple[str, ...],
 ) -> Optional[Path]:
-    """Search directories for a model file matching the given model name."""
     candidates = [
         f"{model_name}.model.yaml",
         f"{model_name}.model.yml",
     ]
     for search_dir in search_dirs:
+        files, subdirs = _dir_listing(search_dir)
         for candidate in candidates:
-            path = search_dir / candidate
-            if path.exists():
-                return path
+            if candidate in files:
+                return Path(search_dir) / candidate
         # Also search subdirectories one level deep
-        if search_dir.is_dir():
-            for sub in sorted(search_dir.iterdir()):
-                if sub.is_dir() and not sub.name.startswith("."):
-                    for candidate in candidates:
-                        path = sub / candidate
-                        if path.exists():
-                            return path
+        for sub in subdirs:
+            sub_files, _ = _dir_listing(os.path.join(search_dir, sub))
+            for candidate in candidates:
+                if candidate in sub_files:
+                    return Path(search_dir) / sub / candidate
     return None
 
 
+def _find_model_file(
+    model_name: str,
+    search_dirs: List[Path],
+) -> Optional[Path]:
+    """Search directories for a model file matching the given model name."""
+    return _find_model_file_cached(model_name, tuple(str(d) for d in search_dirs))
+
+
 def _resolve_import_path(
     imp: Dict[str, Any],
     root_dir: Path,
@@ -52,7 +83,9 @@ def _resolve_import_path(
     """Resolve the file path for an import entry."""
     if imp.get("path"):
         candidate = root_dir / imp["path"]
-        if candidate.exists():
+        # is_file() rather than exists(): same single stat, but a directory
+        # named like a model file no longer resolves as one.
+        if candidate.is_file():
             return candidate.resolve()
         return None
 
@@ -72,6 +105,13 @@ class ResolvedModel:
         self.import_graph: Dict[str, List[str]] = {}  # model_name -> [imported model names]
         self.file_map: Dict[str, str] = {}  # model_name -> file path
         self.issues: List[Issue] = []
+        self.seen_entities: Dict[str, str] = {}  # entity_name -> source model
+        self.import_aliases: Dict[str, List[str]] = {}  # model_name -> import aliases
+        # Lazy caches for the unified_* views; resolution fully populates the
+        # model dicts before any consumer reads them, so first-call build is safe.
+        self._unified_entities: Optional[List[Dict[str, Any]]] = None
+        self._unified_relationships: Optional[List[Dict[str, Any]]] = None
+        self._unified_indexes: Optional[List[Dict[str, Any]]] = None
 
     @property
     def all_model_names(self) -> List[str]:
@@ -80,58 +120,61 @@ class ResolvedModel:
         return [n for n in names if n]
 
     def unified_entities(self) -> List[Dict[str, Any]]:
-        """Return all entities from root + imported models, with source_model annotation."""
+        """Return all entities from root + imported models, with source_model annotation.
+
+        The annotations only add top-level keys, so a shallow dict merge is
+        enough — nested fields still reference the resolver's own copies,
+        which consumers treat as read-only. This avoids deep-copying every
+        field list per access. The built list is cached; repeat calls (e.g.
+        to_graph_summary plus its callers) return the same list.
+        """
+        if self._unified_entities is not None:
+            return self._unified_entities
         entities = []
         root_name = self.root_model.get("model", {}).get("name", "root")
         for entity in self.root_model.get("entities", []):
-            e = copy.deepcopy(entity)
-            e["_source_model"] = root_name
-            entities.append(e)
+            entities.append({**entity, "_source_model": root_name})
 
         for alias, model in sorted(self.imported_models.items()):
             model_name = model.get("model", {}).get("name", alias)
             for entity in model.get("entities", []):
-                e = copy.deepcopy(entity)
-                e["_source_model"] = model_name
-                e["_import_alias"] = alias
-                entities.append(e)
+                entities.append({**entity, "_source_model": model_name, "_import_alias": alias})
 
+        self._unified_entities = entities
         return entities
 
     def unified_relationships(self) -> List[Dict[str, Any]]:
         """Return all relationships from root + imported models."""
+        if self._unified_relationships is not None:
+            return self._unified_relationships
         rels = []
         root_name = self.root_model.get("model", {}).get("name", "root")
         for rel in self.root_model.get("relationships", []):
-            r = copy.deepcopy(rel)
-            r["_source_model"] = root_name
-            rels.append(r)
+            rels.append({**rel, "_source_model": root_name})
 
         for alias, model in sorted(self.imported_models.items()):
             model_name = model.get("model", {}).get("name", alias)
             for rel in model.get("relationships", []):
-                r = copy.deepcopy(rel)
-                r["_source_model"] = model_name
-                rels.append(r)
+                rels.append({**rel, "_source_model": model_name})
 
+        self._unified_relationships = rels
         return rels
 
     def unified_indexes(self) -> List[Dict[str, Any]]:
         """Return all indexes from root + imported models."""
+        if self._unified_indexes is not None:
+            return self._unified_indexes
         indexes = []
         root_name = self.root_model.get("model", {}).get("name", "root")
         for idx in self.root_model.get("indexes", []):
-            i = copy.deepcopy(idx)
-            i["_source_model"] = root_name
-            indexes.append(i)
+            indexes.append({**idx, "_source_model": root_name})
 
         for alias, model in sorted(self.imported_models.items()):
             model_name = model.get("model", {}).get("name", alias)
             for idx in model.get("indexes", []):
-                i = copy.deepcopy(idx)
-                i["_source_model"] = model_name
-                indexes.append(i)
+                indexes.append({**idx, "_source_model": model_name})
 
+        self._unified_indexes = indexes
         return indexes
 
     def to_graph_summary(self) -> Dict[str, Any]:
@@ -146,10 +189,7 @@ class ResolvedModel:
             "file": self.file_map.get(root_name, ""),
             "entity_count": len(root_entities),
             "entities": [e.get("name", "") for e in root_entities],
-            "imports": [
-                imp.get("alias", imp.get("model", ""))
-                for imp in self.root_model.get("model", {}).get("imports", [])
-            ],
+            "imports": self.import_aliases.get(root_name, []),
             "is_root": True,
         })
 
@@ -163,19 +203,22 @@ class ResolvedModel:
                 "file": self.file_map.get(model_name, ""),
                 "entity_count": len(imp_entities),
                 "entities": [e.get("name", "") for e in imp_entities],
-                "imports": [
-                    imp.get("alias", imp.get("model", ""))
-                    for imp in model.get("model", {}).get("imports", [])
-                ],
+                "imports": self.import_aliases.get(model_name, []),
                 "is_root": False,
             })
 
         # Cross-model relationships (relationships that reference entities from different models)
         cross_rels = []
-        all_entities = self.unified_entities()
+        # Map entity -> owning model straight from the original dicts; going
+        # through unified_entities() would annotate (and cache) a copy of
+        # every entity just to read two fields back out.
         entity_to_model = {}
-        for e in all_entities:
-            entity_to_model[e.get("name", "")] = e.get("_source_model", "")
+        for e in self.root_model.get("entities", []):
+            entity_to_model[e.get("name", "")] = root_name
+        for alias, model in sorted(self.imported_models.items()):
+            model_name = model.get("model", {}).get("name", alias)
+            for e in model.get("entities", []):
+                entity_to_model[e.get("name", "")] = model_name
 
         for rel in self.unified_relationships():
             from_entity = (rel.get("from", "") or "").split(".")[0]
@@ -205,29 +248,44 @@ class ResolvedModel:
         }
 
 
-def _detect_cycle(
-    model_name: str,
-    import_graph: Dict[str, List[str]],
-    visiting: Set[str],
-    visited: Set[str],
-) -> bool:
-    """DFS cycle detection in import graph."""
-    if model_name in visiting:
-        return True
-    if model_name in visited:
-        return False
-    visiting.add(model_name)
-    for dep in import_graph.get(model_name, []):
-        if _detect_cycle(dep, import_graph, visiting, visited):
-            return True
-    visiting.remove(model_name)
-    visited.add(model_name)
+_WHITE, _GRAY, _BLACK = 0, 1, 2
+
+
+def _detect_cycle(import_graph: Dict[str, List[str]]) -> bool:
+    """DFS cycle detection over the whole import graph.
+
+    Iterative with an explicit stack (no Python recursion, no depth limit)
+    and started from every node, so cycles among imports that aren't
+    reachable from the root are caught too.
+    """
+    color = {node: _WHITE for node in import_graph}
+    for start in import_graph:
+        if color[start] != _WHITE:
+            continue
+        color[start] = _GRAY
+        stack = [(start, iter(import_graph[start]))]
+        while stack:
+            node, deps = stack[-1]
+            dep = next(deps, None)
+            if dep is None:
+                color[node] = _BLACK
+                stack.pop()
+                continue
+            dep_color = color.get(dep, _WHITE)
+            if dep_color == _GRAY:
+                return True
+            if dep_color == _WHITE:
+                color[dep] = _GRAY
+                stack.append((dep, iter(import_graph.get(dep, ()))))
     return False
 
 
 def resolve_model(
     root_path: str,
     search_dirs: Optional[List[str]] = None,
+    _shared_loaded: Optional[Dict[str, Dict[str, Any]]] = None,
+    _shared_paths: Optional[Dict[str, str]] = None,
+    _preparsed_root: Optional[Dict[str, Any]] = None,
 ) -> ResolvedModel:
     """Resolve a model file and all its imports into a ResolvedModel.
 
@@ -235,6 +293,13 @@ def resolve_model(
         root_path: Path to the root model YAML file.
         search_dirs: Additional directories to search for imported models.
                      The root model's directory is always searched first.
+        _shared_loaded: Internal — parse cache shared across calls so
+                        resolve_project parses each imported YAML once per
+                        project rather than once per root model.
+        _shared_paths: Internal — model name → file path map paired with
+                       _shared_loaded.
+        _preparsed_root: Internal — already-parsed root model, so
+                         resolve_project's parallel pre-parse isn't repeated.
 
     Returns:
         ResolvedModel with all imported models resolved and issues collected.
@@ -247,7 +312,7 @@ def resolve_model(
 
     # Load root model
     try:
-        root_model = load_yaml_model(str(root_file))
+        root_model = _preparsed_root if _preparsed_root is not None else load_yaml_model(str(root_file))
     except Exception as exc:
         result.issues.append(Issue(
             severity="error",
@@ -268,23 +333,31 @@ def resolve_model(
     # Track import graph for cycle detection
     result.import_graph[root_name] = []
 
+    # Seed the duplicate-entity map with the root's entities; imported
+    # entities are checked against it as each import is resolved.
+    for entity in root_model.get("entities", []):
+        ename = entity.get("name", "")
+        if ename:
+            result.seen_entities[ename] = root_name
+
     # Resolve each import
-    loaded_models: Dict[str, Dict[str, Any]] = {}  # model_name -> model data
+    loaded_models = _shared_loaded if _shared_loaded is not None else {}  # model_name -> model data
+    loaded_paths = _shared_paths if _shared_paths is not None else {}  # model_name -> file path
     _resolve_imports_recursive(
         model_name=root_name,
         imports=imports,
         root_dir=root_dir,
         search_dirs=extra_dirs,
         loaded_models=loaded_models,
+        loaded_paths=loaded_paths,
         result=result,
+        expanded=set(),
         depth=0,
         max_depth=10,
     )
 
     # Cycle detection
-    visiting: Set[str] = set()
-    visited: Set[str] = set()
-    if _detect_cycle(root_name, result.import_graph, visiting, visited):
+    if _detect_cycle(result.import_graph):
         result.issues.append(Issue(
             severity="error",
             code="CIRCULAR_IMPORT",
@@ -292,28 +365,6 @@ def resolve_model(
             path="/model/imports",
         ))
 
-    # Check for duplicate entity names across all models
-    seen_entities: Dict[str, str] = {}  # entity_name -> source_model
-    for entity in result.root_model.get("entities", []):
-        ename = entity.get("name", "")
-        if ename:
-            seen_entities[ename] = root_name
-
-    for alias, model in result.imported_models.items():
-        model_name = model.get("model", {}).get("name", alias)
-        for entity in model.get("entities", []):
-            ename = entity.get("name", "")
-            if ename and ename in seen_entities:
-                result.issues.append(Issue(
-                    severity="warn",
-                    code="DUPLICATE_CROSS_MODEL_ENTITY",
-                    message=f"Entity '{ename}' exists in both '{seen_entities[ename]}' and '{model_name}'. "
-                            f"Use alias '{alias}' to disambiguate.",
-                    path=f"/model/imports",
-                ))
-            elif ename:
-                seen_entities[ename] = model_name
-
     return result
 
 
@@ -323,7 +374,9 @@ def _resolve_imports_recursive(
     root_dir: Path,
     search_dirs: List[Path],
     loaded_models: Dict[str, Dict[str, Any]],
+    loaded_paths: Dict[str, str],
     result: ResolvedModel,
+    expanded: Set[str],
     depth: int,
     max_depth: int,
 ) -> None:
@@ -351,14 +404,20 @@ def _resolve_imports_recursive(
             ))
             continue
 
-        # Track in import graph
+        # Track in import graph; the alias list feeds to_graph_summary so it
+        # never re-walks the raw imports.
         if model_name not in result.import_graph:
             result.import_graph[model_name] = []
         result.import_graph[model_name].append(imp_model_name)
+        result.import_aliases.setdefault(model_name, []).append(alias)
 
-        # Skip if already loaded
+        # Skip the parse if already loaded (possibly by another resolve via
+        # the shared project cache); sub-imports are still expanded below the
+        # first time this resolve encounters the model.
         if imp_model_name in loaded_models:
             model_data = loaded_models[imp_model_name]
+            if imp_model_name in loaded_paths:
+                result.file_map.setdefault(imp_model_name, loaded_paths[imp_model_name])
         else:
             # Resolve file path
             file_path = _resolve_import_path(imp, root_dir, search_dirs)
@@ -392,41 +451,70 @@ def _resolve_imports_recursive(
                 ))
 
             loaded_models[imp_model_name] = model_data
+            loaded_paths[imp_model_name] = str(file_path)
             result.file_map[imp_model_name] = str(file_path)
 
-            # Recursively resolve this model's imports
+        # Recursively resolve this model's imports, at most once per resolve.
+        if imp_model_name not in expanded:
+            expanded.add(imp_model_name)
             sub_imports = model_data.get("model", {}).get("imports", [])
             if sub_imports:
+                sub_path = loaded_paths.get(imp_model_name)
                 _resolve_imports_recursive(
                     model_name=imp_model_name,
                     imports=sub_imports,
-                    root_dir=file_path.parent,
+                    root_dir=Path(sub_path).parent if sub_path else root_dir,
                     search_dirs=search_dirs,
                     loaded_models=loaded_models,
+                    loaded_paths=loaded_paths,
                     result=result,
+                    expanded=expanded,
                     depth=depth + 1,
                     max_depth=max_depth,
                 )
 
-        # Apply entity filter if specified
+        # Apply entity filter if specified. The resolver never mutates the
+        # nested structures after assignment, so sharing them with
+        # loaded_models is safe — a filtered import needs only a fresh
+        # top-level dict with its own entity list, and an unfiltered one can
+        # reference the parsed model directly.
         if entity_filter:
-            filtered = copy.deepcopy(model_data)
+            filtered = dict(model_data)
+            wanted = set(entity_filter)
             available = {e.get("name", "") for e in model_data.get("entities", [])}
-            for requested in entity_filter:
-                if requested not in available:
-                    result.issues.append(Issue(
-                        severity="error",
-                        code="IMPORT_ENTITY_NOT_FOUND",
-                        message=f"Import '{alias}' requests entity '{requested}' which does not exist in '{imp_model_name}'.",
-                        path="/model/imports",
-                    ))
+            for requested in sorted(wanted - available):
+                result.issues.append(Issue(
+                    severity="error",
+                    code="IMPORT_ENTITY_NOT_FOUND",
+                    message=f"Import '{alias}' requests entity '{requested}' which does not exist in '{imp_model_name}'.",
+                    path="/model/imports",
+                ))
             filtered["entities"] = [
                 e for e in model_data.get("entities", [])
-                if e.get("name", "") in set(entity_filter)
+                if e.get("name", "") in wanted
             ]
-            result.imported_models[alias] = filtered
+            imported = filtered
         else:
-            result.imported_models[alias] = copy.deepcopy(model_data)
+            imported = model_data
+        result.imported_models[alias] = imported
+
+        # Duplicate-entity check, fused into the same pass: the entity lists
+        # were already materialized just above, so this avoids re-walking
+        # every imported model after resolution.
+        seen_entities = result.seen_entities
+        declared_name = model_data.get("model", {}).get("name", alias)
+        for entity in imported.get("entities", []):
+            ename = entity.get("name", "")
+            if ename and ename in seen_entities:
+                result.issues.append(Issue(
+                    severity="warn",
+                    code="DUPLICATE_CROSS_MODEL_ENTITY",
+                    message=f"Entity '{ename}' exists in both '{seen_entities[ename]}' and '{declared_name}'. "
+                            f"Use alias '{alias}' to disambiguate.",
+                    path=f"/model/imports",
+                ))
+            elif ename:
+                seen_entities[ename] = declared_name
 
 
 def resolve_project(
@@ -448,9 +536,65 @@ def resolve_project(
 
     extra_dirs = [Path(d).resolve() for d in (search_dirs or [])]
     all_dirs = [project_path] + extra_dirs
+    # Stringified once; every resolve_model call below gets the same list.
+    search_dir_strs = [str(d) for d in all_dirs]
+
+    # Imports shared by several root models are parsed once per project.
+    shared_loaded: Dict[str, Dict[str, Any]] = {}
+    shared_paths: Dict[str, str] = {}
+
+    # Pre-parse every project file concurrently: libyaml releases the GIL
+    # while parsing, so threads overlap the dominant cost. The parsed models
+    # seed the shared import cache (keyed by declared name) and are handed to
+    # resolve_model as pre-parsed roots so nothing is parsed twice.
+    preparsed: Dict[str, Dict[str, Any]] = {}
+    if len(model_files) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        def _parse(path: Path) -> Tuple[str, Optional[Dict[str, Any]]]:
+            try:
+                return str(path), load_yaml_model(str(path))
+            except Exception:
+                # Leave the error to resolve_model so its issue reporting
+                # stays in one place.
+                return str(path), None
+
+        def _resolve(path: Path) -> Tuple[str, ResolvedModel]:
+            return str(path), resolve_model(
+                str(path),
+                search_dirs=search_dir_strs,
+                _shared_loaded=shared_loaded,
+                _shared_paths=shared_paths,
+                _preparsed_root=preparsed.get(str(path)),
+            )
+
+        with ThreadPoolExecutor(max_workers=min(8, len(model_files))) as executor:
+            for path_str, model in executor.map(_parse, model_files):
+                if model is None:
+                    continue
+                preparsed[path_str] = model
+                declared = model.get("model", {}).get("name", "")
+                if declared and declared not in shared_loaded:
+                    shared_loaded[declared] = model
+                    shared_paths[declared] = path_str
+
+            # Each resolve is independent: per-root state lives on its own
+            # ResolvedModel, and the shared caches only ever see atomic dict
+            # stores of fully built values (worst case, two threads parse the
+            # same off-project import once each). executor.map preserves the
+            # sorted file order.
+            for path_str, resolved in executor.map(_resolve, model_files):
+                results[path_str] = resolved
+        return results
 
     for model_file in model_files:
-        resolved = resolve_model(str(model_file), search_dirs=[str(d) for d in all_dirs])
+        resolved = resolve_model(
+            str(model_file),
+            search_dirs=search_dir_strs,
+            _shared_loaded=shared_loaded,
+            _shared_paths=shared_paths,
+            _preparsed_root=preparsed.get(str(model_file)),
+        )
         results[str(model_file)] = resolved
 
     return results
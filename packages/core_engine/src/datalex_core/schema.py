@@ -1,6 +1,7 @@
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from jsonschema import Draft202012Validator
 
@@ -8,12 +9,19 @@ from datalex_core.issues import Issue
 from datalex_core.modeling import normalize_model
 
 
+@lru_cache(maxsize=None)
+def _load_schema_cached(resolved_path: str, mtime_ns: int) -> Dict[str, Any]:
+    with open(resolved_path, "r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
 def load_schema(schema_path: str) -> Dict[str, Any]:
     path = Path(schema_path)
     if not path.exists():
         raise FileNotFoundError(f"Schema file not found: {schema_path}")
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    # Memoized on (path, mtime) so long-lived processes (validate-all, gate,
+    # the api-server) parse each schema JSON once instead of per invocation.
+    return _load_schema_cached(str(path.resolve()), path.stat().st_mtime_ns)
 
 
 def _to_json_path(parts: List[Any]) -> str:
@@ -35,10 +43,30 @@ def _looks_like_model_schema(schema: Dict[str, Any]) -> bool:
     return "model" in properties and "entities" in properties
 
 
+# Compiled-validator cache keyed on the schema dict's identity. load_schema
+# memoizes the dict per (path, mtime), so repeated validations in the same
+# process (validate-all, gate, the api-server) reuse one compiled validator
+# instead of re-walking the schema on every call. The schema object is kept
+# in the entry so a recycled id() can't alias a different dict.
+_VALIDATOR_CACHE: Dict[int, Tuple[Dict[str, Any], Draft202012Validator]] = {}
+
+
+def _validator_for(schema: Dict[str, Any]) -> Draft202012Validator:
+    key = id(schema)
+    entry = _VALIDATOR_CACHE.get(key)
+    if entry is not None and entry[0] is schema:
+        return entry[1]
+    validator = Draft202012Validator(schema)
+    if len(_VALIDATOR_CACHE) >= 8:
+        _VALIDATOR_CACHE.clear()
+    _VALIDATOR_CACHE[key] = (schema, validator)
+    return validator
+
+
 def schema_issues(model: Dict[str, Any], schema: Dict[str, Any]) -> List[Issue]:
     if _looks_like_model_schema(schema):
         model = normalize_model(model)
-    validator = Draft202012Validator(schema)
+    validator = _validator_for(schema)
     issues: List[Issue] = []
 
     for error in sorted(validator.iter_errors(model), key=lambda e: list(e.absolute_path)):
@@ -66,6 +66,85 @@ def _make_model(**overrides) -> Dict[str, Any]:
 # Migration generator
 # ===========================================================================
 
+class TestIterModelFiles(unittest.TestCase):
+    """Glob walker used by validate-all: exclude pruning semantics."""
+
+    def _touch(self, root: str, rel: str) -> None:
+        path = os.path.join(root, rel)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as fh:
+            fh.write("x: 1\n")
+
+    def test_file_exclude_does_not_prune_parent_dir(self):
+        from datalex_cli.main import _iter_model_files
+        with tempfile.TemporaryDirectory() as tmp:
+            self._touch(tmp, "models/a.model.yaml")
+            self._touch(tmp, "models/old.model.yaml")
+            self._touch(tmp, "models/sub/b.model.yaml")
+            cwd = os.getcwd()
+            os.chdir(tmp)
+            try:
+                found = _iter_model_files("models/**/*.model.yaml", ["models/old.model.yaml"])
+            finally:
+                os.chdir(cwd)
+            # The file-level exclude is applied by the caller's regex filter;
+            # the walker itself must still descend into models/.
+            self.assertEqual(found, [
+                "models/a.model.yaml",
+                "models/old.model.yaml",
+                "models/sub/b.model.yaml",
+            ])
+
+    def test_directory_exclude_prunes_subtree(self):
+        from datalex_cli.main import _iter_model_files
+        with tempfile.TemporaryDirectory() as tmp:
+            self._touch(tmp, "models/a.model.yaml")
+            self._touch(tmp, "node_modules/pkg/c.model.yaml")
+            cwd = os.getcwd()
+            os.chdir(tmp)
+            try:
+                found = _iter_model_files("**/*.model.yaml", ["**/node_modules/**"])
+            finally:
+                os.chdir(cwd)
+            self.assertEqual(found, ["models/a.model.yaml"])
+
+    def test_anchored_exclude_does_not_prune_same_name_elsewhere(self):
+        from datalex_cli.main import _iter_model_files
+        with tempfile.TemporaryDirectory() as tmp:
+            self._touch(tmp, "models/legacy/x.model.yaml")
+            self._touch(tmp, "other/legacy/y.model.yaml")
+            cwd = os.getcwd()
+            os.chdir(tmp)
+            try:
+                found = _iter_model_files("**/*.model.yaml", ["models/legacy/**"])
+            finally:
+                os.chdir(cwd)
+            # models/legacy/** only excludes that one subtree; the walker must
+            # still visit other/legacy/ (the anchored pattern itself is applied
+            # by the caller's regex filter, not by pruning).
+            self.assertEqual(found, [
+                "models/legacy/x.model.yaml",
+                "other/legacy/y.model.yaml",
+            ])
+
+    def test_trailing_doublestar_glob(self):
+        from datalex_cli.main import _iter_model_files
+        with tempfile.TemporaryDirectory() as tmp:
+            self._touch(tmp, "models/a.model.yaml")
+            self._touch(tmp, "models/sub/b.model.yaml")
+            self._touch(tmp, "node_modules/pkg/c.model.yaml")
+            cwd = os.getcwd()
+            os.chdir(tmp)
+            try:
+                found = _iter_model_files("models/**", ["**/node_modules/**"])
+            finally:
+                os.chdir(cwd)
+            self.assertEqual(found, [
+                "models/a.model.yaml",
+                "models/sub/b.model.yaml",
+            ])
+
+
 class TestMigrationGenerator(unittest.TestCase):
     """Tests for generate_migration."""
 
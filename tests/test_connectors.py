@@ -485,6 +485,152 @@ class TestDriverChecks(unittest.TestCase):
         self.assertIsInstance(msg, str)
 
 
+# ===========================================================================
+# Snowflake constraint pull (fake cursor)
+# ===========================================================================
+
+class _FakeSnowflakeCursor:
+    """Replays canned result sets keyed by the statement being executed."""
+
+    def __init__(self, results: Dict[str, list]):
+        self._results = results
+        self._current: list = []
+        self._offset = 0
+        self.executed: list = []
+
+    def execute(self, sql, params=None):
+        self.executed.append(" ".join(sql.split()))
+        upper = sql.upper()
+        if "INFORMATION_SCHEMA.TABLES" in upper:
+            self._current = self._results["tables"]
+        elif "INFORMATION_SCHEMA.COLUMNS" in upper:
+            self._current = self._results["columns"]
+        elif upper.startswith("SHOW PRIMARY KEYS"):
+            self._current = self._results["pks"]
+        elif upper.startswith("SHOW IMPORTED KEYS"):
+            self._current = self._results["fks"]
+        else:
+            self._current = []
+        self._offset = 0
+
+    def fetchall(self):
+        return list(self._current)
+
+    def fetchmany(self, size):
+        chunk = self._current[self._offset:self._offset + size]
+        self._offset += size
+        return chunk
+
+    def close(self):
+        pass
+
+
+class _FakeSnowflakeConnection:
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def cursor(self):
+        return self._cursor
+
+
+class TestSnowflakePullAll(unittest.TestCase):
+    """pull_all fans per-schema pulls out concurrently and merges results."""
+
+    def test_merges_schemas(self):
+        connector = SnowflakeConnector()
+        config = ConnectorConfig(connector_type="snowflake", database="DB")
+
+        def fake_pull_schema(cfg):
+            entity = {"name": cfg.schema.title(), "type": "table", "fields": []}
+            model = {"entities": [entity], "relationships": []}
+            return ConnectorResult(model=model, tables_found=1, columns_found=2,
+                                   warnings=[f"warn-{cfg.schema}"])
+
+        with patch.object(SnowflakeConnector, "pull_schema", side_effect=fake_pull_schema):
+            result = connector.pull_all(config, ["SALES", "FINANCE"])
+
+        self.assertEqual([e["name"] for e in result.model["entities"]], ["Sales", "Finance"])
+        self.assertEqual(result.tables_found, 2)
+        self.assertEqual(result.columns_found, 4)
+        self.assertEqual(result.warnings, ["warn-SALES", "warn-FINANCE"])
+
+    def test_defaults_to_listed_schemas(self):
+        connector = SnowflakeConnector()
+        config = ConnectorConfig(connector_type="snowflake", database="DB")
+        pulled = []
+
+        def fake_pull_schema(cfg):
+            pulled.append(cfg.schema)
+            return ConnectorResult(model={"entities": [], "relationships": []})
+
+        with patch.object(SnowflakeConnector, "list_schemas",
+                          return_value=[{"name": "A"}, {"name": "B"}]), \
+             patch.object(SnowflakeConnector, "pull_schema", side_effect=fake_pull_schema):
+            connector.pull_all(config, None)
+
+        self.assertEqual(sorted(pulled), ["A", "B"])
+
+
+class TestSnowflakePullConstraints(unittest.TestCase):
+    """Exercises _pull's bulk SHOW PRIMARY/IMPORTED KEYS constraint path."""
+
+    # SHOW IMPORTED KEYS row layout (the slice _pull reads):
+    # [2]=pk_table [3]=pk_column [6]=fk_table [7]=fk_column [11]=fk_name
+    FK_ROW = ("2024-01-01", "DB", "USERS", "ID",
+              "DB", "PUBLIC", "ORDERS", "USER_ID",
+              1, "NO ACTION", "NO ACTION", "ORDERS_USERS_FK")
+    # SHOW PRIMARY KEYS row layout: [3]=table_name [4]=column_name
+    PK_ROWS = [
+        ("2024-01-01", "DB", "PUBLIC", "USERS", "ID", 1, "USERS_PK"),
+        ("2024-01-01", "DB", "PUBLIC", "ORDERS", "ID", 1, "ORDERS_PK"),
+    ]
+
+    def _pull(self, pk_rows, fk_rows):
+        cursor = _FakeSnowflakeCursor({
+            "tables": [("USERS", "BASE TABLE"), ("ORDERS", "BASE TABLE")],
+            "columns": [
+                ("USERS", "ID", "NUMBER", "NO", None, None, 38, 0),
+                ("USERS", "EMAIL", "TEXT", "YES", None, 255, None, None),
+                ("ORDERS", "ID", "NUMBER", "NO", None, None, 38, 0),
+                ("ORDERS", "USER_ID", "NUMBER", "YES", None, None, 38, 0),
+            ],
+            "pks": pk_rows,
+            "fks": fk_rows,
+        })
+        config = ConnectorConfig(connector_type="snowflake", database="DB", schema="PUBLIC")
+        result = SnowflakeConnector()._pull(_FakeSnowflakeConnection(cursor), config)
+        return result, cursor
+
+    def _field(self, result, entity_name, field_name):
+        entity = next(e for e in result.model["entities"] if e["name"] == entity_name)
+        return next(f for f in entity["fields"] if f["name"] == field_name)
+
+    def test_primary_keys_applied_from_show(self):
+        result, _ = self._pull(self.PK_ROWS, [])
+        for ename in ("USERS", "ORDERS"):
+            pk = self._field(result, ename, "id")
+            self.assertTrue(pk["primary_key"])
+            self.assertFalse(pk["nullable"])
+        self.assertFalse(any("Could not fetch" in w for w in result.warnings))
+
+    def test_foreign_keys_applied_from_show(self):
+        result, _ = self._pull(self.PK_ROWS, [self.FK_ROW])
+        self.assertTrue(self._field(result, "ORDERS", "user_id")["foreign_key"])
+        self.assertEqual(result.relationships_found, 1)
+        rel = result.model["relationships"][0]
+        self.assertEqual(rel["name"], "ORDERS_USERS_FK")
+        self.assertEqual(rel["from"], "USERS.id")
+        self.assertEqual(rel["to"], "ORDERS.user_id")
+        self.assertEqual(rel["cardinality"], "one_to_many")
+
+    def test_one_round_trip_per_constraint_type(self):
+        _, cursor = self._pull(self.PK_ROWS, [self.FK_ROW])
+        pk_stmts = [s for s in cursor.executed if s.startswith("SHOW PRIMARY KEYS")]
+        fk_stmts = [s for s in cursor.executed if s.startswith("SHOW IMPORTED KEYS")]
+        self.assertEqual(pk_stmts, ["SHOW PRIMARY KEYS IN SCHEMA DB.PUBLIC"])
+        self.assertEqual(fk_stmts, ["SHOW IMPORTED KEYS IN SCHEMA DB.PUBLIC"])
+
+
 # ===========================================================================
 # CLI parser
 # ===========================================================================
@@ -506,6 +652,15 @@ class TestCLIParser(unittest.TestCase):
         args = parser.parse_args(["pull", "snowflake", "--host", "acct.snowflakecomputing.com", "--warehouse", "WH"])
         self.assertEqual(args.connector, "snowflake")
         self.assertEqual(args.warehouse, "WH")
+        self.assertIsNone(args.schemas)
+
+    def test_pull_parser_multi_schema(self):
+        from datalex_cli.main import build_parser
+        parser = build_parser()
+        args = parser.parse_args(["pull", "snowflake", "--host", "acct", "--schemas", "SALES", "FINANCE"])
+        self.assertEqual(args.schemas, ["SALES", "FINANCE"])
+        args = parser.parse_args(["pull", "snowflake", "--host", "acct", "--schemas"])
+        self.assertEqual(args.schemas, [])
 
     def test_pull_parser_bigquery(self):
         from datalex_cli.main import build_parser
@@ -173,6 +173,47 @@ class TestSQLDDLEnhanced:
         fields = {f["name"]: f for f in entity["fields"]}
         assert fields["customer_id"].get("primary_key") is True
 
+    def test_leading_comment_headers(self):
+        """pg_dump-style -- headers before each statement still classify."""
+        ddl = """--
+-- Name: users; Type: TABLE; Schema: public
+--
+
+CREATE TABLE users (
+    id BIGINT PRIMARY KEY,
+    email TEXT
+);
+
+-- don't trip the quote scanner
+-- Name: orders; Type: TABLE
+CREATE TABLE orders (
+    id BIGINT PRIMARY KEY,
+    user_id BIGINT REFERENCES users(id)
+);
+"""
+        model = import_sql_ddl(ddl)
+        names = {e["name"] for e in model["entities"]}
+        assert names == {"Users", "Orders"}
+        rel_pairs = {(r["from"], r["to"]) for r in model["relationships"]}
+        assert ("Users.id", "Orders.user_id") in rel_pairs
+
+    def test_leading_block_comments(self):
+        """/* ... */ banners before a statement still classify."""
+        ddl = """/* header */
+CREATE TABLE users (id INT PRIMARY KEY, name TEXT);
+
+/* multi
+   line
+   banner */
+-- mixed with a line comment
+CREATE TABLE orders (id INT PRIMARY KEY, user_id INT REFERENCES users(id));
+"""
+        model = import_sql_ddl(ddl)
+        names = {e["name"] for e in model["entities"]}
+        assert names == {"Users", "Orders"}
+        rel_pairs = {(r["from"], r["to"]) for r in model["relationships"]}
+        assert ("Users.id", "Orders.user_id") in rel_pairs
+
     def test_table_level_check_skipped(self):
         ddl = """
         CREATE TABLE products (
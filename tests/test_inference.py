@@ -1,90 +1,152 @@
 """Tests for PK/FK inference engine in base connector."""
 
+import copy
+import time
+from types import MappingProxyType
+
 import pytest
+
 from datalex_core.connectors.base import infer_primary_keys, infer_relationships
 
+# Keep the module on one xdist worker so the module-scoped fixtures
+# (template, PK template, rel_index) are built once per run, not per worker.
+pytestmark = pytest.mark.xdist_group(name="inference")
+
 
 # ---------------------------------------------------------------------------
 # Test data: simulates a Snowflake/BigQuery pull with NO constraints
 # ---------------------------------------------------------------------------
 
+_FIELD_TYPES = {
+    "email": "string",
+    "name": "string",
+    "status": "string",
+    "total": "decimal",
+    "price": "decimal",
+    "quantity": "integer",
+    "created_at": "timestamp",
+}
+
+_SCHEMA = [
+    ("Users", ["id", "email", "name", "created_at"]),
+    ("Orders", ["id", "user_id", "total", "status"]),
+    ("OrderItems", ["id", "order_id", "product_id", "quantity", "price"]),
+    ("Products", ["product_id", "name", "category_id", "price"]),
+    ("Categories", ["category_id", "name", "parent_id"]),
+]
+
+
 def _make_entities():
     """Typical e-commerce schema with naming conventions but no PK/FK defined."""
     return [
         {
-            "name": "Users",
-            "type": "table",
-            "fields": [
-                {"name": "id", "type": "bigint", "nullable": True},
-                {"name": "email", "type": "string", "nullable": True},
-                {"name": "name", "type": "string", "nullable": True},
-                {"name": "created_at", "type": "timestamp", "nullable": True},
-            ],
-        },
-        {
-            "name": "Orders",
-            "type": "table",
-            "fields": [
-                {"name": "id", "type": "bigint", "nullable": True},
-                {"name": "user_id", "type": "bigint", "nullable": True},
-                {"name": "total", "type": "decimal", "nullable": True},
-                {"name": "status", "type": "string", "nullable": True},
-            ],
-        },
-        {
-            "name": "OrderItems",
+            "name": entity_name,
             "type": "table",
             "fields": [
-                {"name": "id", "type": "bigint", "nullable": True},
-                {"name": "order_id", "type": "bigint", "nullable": True},
-                {"name": "product_id", "type": "bigint", "nullable": True},
-                {"name": "quantity", "type": "integer", "nullable": True},
-                {"name": "price", "type": "decimal", "nullable": True},
+                {"name": field, "type": _FIELD_TYPES.get(field, "bigint"), "nullable": True}
+                for field in fields
             ],
-        },
-        {
-            "name": "Products",
-            "type": "table",
-            "fields": [
-                {"name": "product_id", "type": "bigint", "nullable": True},
-                {"name": "name", "type": "string", "nullable": True},
-                {"name": "category_id", "type": "bigint", "nullable": True},
-                {"name": "price", "type": "decimal", "nullable": True},
-            ],
-        },
-        {
-            "name": "Categories",
-            "type": "table",
-            "fields": [
-                {"name": "category_id", "type": "bigint", "nullable": True},
-                {"name": "name", "type": "string", "nullable": True},
-                {"name": "parent_id", "type": "bigint", "nullable": True},
-            ],
-        },
+        }
+        for entity_name, fields in _SCHEMA
     ]
 
 
+_EXPECTED_RELS = frozenset({
+    ("Users.id", "Orders.user_id"),
+    ("Orders.id", "OrderItems.order_id"),
+    ("Products.product_id", "OrderItems.product_id"),
+    ("Categories.category_id", "Products.category_id"),
+})
+
+
+def _freeze(value):
+    """Recursively wrap dicts in read-only proxies and lists in tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _by_name(items):
+    """Index a list of named dicts for O(1) lookup instead of next() scans."""
+    return {item["name"]: item for item in items}
+
+
+def _parse_pk_msgs(msgs):
+    """Parse 'Inferred PK: Entity.field' messages into {entity: field}."""
+    prefix = "Inferred PK: "
+    return dict(
+        m[len(prefix):].split(".", 1) for m in msgs if m.startswith(prefix)
+    )
+
+
+@pytest.fixture(scope="module")
+def _entities_template():
+    """Built once per module; tests get their own copies via `entities`."""
+    return _make_entities()
+
+
+@pytest.fixture
+def entities(_entities_template):
+    """Per-test deep copy of the template — both inference passes mutate
+    field dicts in place, so tests must not share the module-scoped copy."""
+    return copy.deepcopy(_entities_template)
+
+
+@pytest.fixture(scope="module")
+def _pk_template(_entities_template):
+    """Template with PK inference already applied, run once per module."""
+    ents = copy.deepcopy(_entities_template)
+    infer_primary_keys(ents)
+    return ents
+
+
+@pytest.fixture
+def entities_with_pks(_pk_template):
+    """Per-test deep copy of the PK-annotated template, for FK tests whose
+    infer_primary_keys call was pure setup."""
+    return copy.deepcopy(_pk_template)
+
+
+@pytest.fixture(scope="module")
+def entities_ro(_entities_template):
+    """Frozen view of the template for read-only assertions: no deepcopy,
+    and accidental mutation raises instead of leaking into other tests."""
+    return _freeze(_entities_template)
+
+
+@pytest.fixture(scope="module")
+def rel_index(_pk_template):
+    """(from, to) -> relationship map from a single infer_relationships run.
+
+    Module-scoped: the FK assertions only read from it, so one inference
+    pass serves every lookup-style test.
+    """
+    ents = copy.deepcopy(_pk_template)
+    rels, _ = infer_relationships(ents)
+    return {(rel["from"], rel["to"]): rel for rel in rels}
+
+
 # ---------------------------------------------------------------------------
 # PK inference tests
 # ---------------------------------------------------------------------------
 
 class TestInferPrimaryKeys:
-    def test_infers_id_column(self):
-        entities = _make_entities()
+    def test_infers_id_column(self, entities):
         result, msgs = infer_primary_keys(entities)
         # Users, Orders, OrderItems all have 'id' → should be PK
+        by_name = _by_name(result)
         for ename in ("Users", "Orders", "OrderItems"):
-            ent = next(e for e in result if e["name"] == ename)
-            id_field = next(f for f in ent["fields"] if f["name"] == "id")
+            id_field = _by_name(by_name[ename]["fields"])["id"]
             assert id_field["primary_key"] is True
             assert id_field["nullable"] is False
 
-    def test_infers_table_name_id(self):
-        entities = _make_entities()
+    def test_infers_table_name_id(self, entities):
         result, msgs = infer_primary_keys(entities)
         # Products has 'product_id' → matches entity name pattern
-        products = next(e for e in result if e["name"] == "Products")
-        pk = next(f for f in products["fields"] if f["name"] == "product_id")
+        products = _by_name(result)["Products"]
+        pk = _by_name(products["fields"])["product_id"]
         assert pk["primary_key"] is True
 
     def test_skips_entities_with_existing_pk(self):
@@ -106,11 +168,11 @@ class TestInferPrimaryKeys:
         result, msgs = infer_primary_keys(entities)
         assert len(msgs) == 0
 
-    def test_messages_report_inferred_pks(self):
-        entities = _make_entities()
+    def test_messages_report_inferred_pks(self, entities):
         _, msgs = infer_primary_keys(entities)
-        assert any("Inferred PK: Users.id" in m for m in msgs)
-        assert any("Inferred PK: Orders.id" in m for m in msgs)
+        pks = _parse_pk_msgs(msgs)
+        assert pks["Users"] == "id"
+        assert pks["Orders"] == "id"
 
 
 # ---------------------------------------------------------------------------
@@ -118,58 +180,38 @@ class TestInferPrimaryKeys:
 # ---------------------------------------------------------------------------
 
 class TestInferRelationships:
-    def test_infers_user_id_fk(self):
-        entities = _make_entities()
-        infer_primary_keys(entities)  # need PKs first
-        rels, msgs = infer_relationships(entities)
-        # Orders.user_id → Users.id
-        user_rel = [r for r in rels if "user_id" in r["to"]]
-        assert len(user_rel) == 1
-        assert user_rel[0]["from"] == "Users.id"
-        assert user_rel[0]["to"] == "Orders.user_id"
-        assert user_rel[0]["cardinality"] == "one_to_many"
-
-    def test_infers_order_id_fk(self):
-        entities = _make_entities()
-        infer_primary_keys(entities)
-        rels, msgs = infer_relationships(entities)
-        # OrderItems.order_id → Orders.id
-        order_rel = [r for r in rels if "OrderItems.order_id" in r["to"]]
-        assert len(order_rel) == 1
-        assert order_rel[0]["from"] == "Orders.id"
-
-    def test_infers_product_id_fk(self):
-        entities = _make_entities()
-        infer_primary_keys(entities)
-        rels, msgs = infer_relationships(entities)
-        # OrderItems.product_id → Products.product_id
-        prod_rel = [r for r in rels if "OrderItems.product_id" in r["to"]]
-        assert len(prod_rel) == 1
-        assert prod_rel[0]["from"] == "Products.product_id"
-
-    def test_infers_category_id_fk(self):
-        entities = _make_entities()
-        infer_primary_keys(entities)
-        rels, msgs = infer_relationships(entities)
-        # Products.category_id → Categories.category_id
-        cat_rel = [r for r in rels if "Products.category_id" in r["to"]]
-        assert len(cat_rel) == 1
-        assert cat_rel[0]["from"] == "Categories.category_id"
-
-    def test_does_not_self_reference_pk(self):
+    @pytest.fixture(autouse=True)
+    def _setup_entities(self, entities_with_pks):
+        """One PK-annotated schema per test, without per-test boilerplate."""
+        self.entities = entities_with_pks
+
+    @pytest.mark.parametrize(
+        ("from_ref", "to_ref"),
+        [
+            ("Users.id", "Orders.user_id"),
+            ("Orders.id", "OrderItems.order_id"),
+            ("Products.product_id", "OrderItems.product_id"),
+            ("Categories.category_id", "Products.category_id"),
+        ],
+    )
+    def test_infers_fk(self, rel_index, from_ref, to_ref):
+        assert rel_index[(from_ref, to_ref)]["cardinality"] == "one_to_many"
+
+    def test_user_id_only_targets_orders(self, rel_index):
+        # Orders.user_id is the only inferred user_id column
+        assert [to for _, to in rel_index if "user_id" in to] == ["Orders.user_id"]
+
+    def test_does_not_self_reference_pk(self, rel_index):
         """product_id in Products should NOT create a self-referencing FK."""
-        entities = _make_entities()
-        infer_primary_keys(entities)
-        rels, msgs = infer_relationships(entities)
-        self_refs = [r for r in rels if r["from"].startswith("Products.") and r["to"].startswith("Products.")]
-        assert len(self_refs) == 0
+        assert not any(
+            f.startswith("Products.") and t.startswith("Products.")
+            for f, t in rel_index
+        )
 
     def test_marks_fk_flag_on_field(self):
-        entities = _make_entities()
-        infer_primary_keys(entities)
-        infer_relationships(entities)
-        orders = next(e for e in entities if e["name"] == "Orders")
-        user_id_field = next(f for f in orders["fields"] if f["name"] == "user_id")
+        infer_relationships(self.entities)
+        orders = _by_name(self.entities)["Orders"]
+        user_id_field = _by_name(orders["fields"])["user_id"]
         assert user_id_field.get("foreign_key") is True
 
     def test_skips_existing_fk_fields(self):
@@ -186,18 +228,14 @@ class TestInferRelationships:
         assert len(rels) == 0  # already marked, skip
 
     def test_skips_existing_relationships(self):
-        entities = _make_entities()
-        infer_primary_keys(entities)
         existing = [{"from": "Users.id", "to": "Orders.user_id", "name": "existing_fk", "cardinality": "one_to_many"}]
-        rels, msgs = infer_relationships(entities, existing)
+        rels, msgs = infer_relationships(self.entities, existing)
         # Should not duplicate the Users→Orders relationship
         user_rels = [r for r in rels if "Orders.user_id" in r["to"]]
         assert len(user_rels) == 0
 
     def test_inferred_flag_set(self):
-        entities = _make_entities()
-        infer_primary_keys(entities)
-        rels, _ = infer_relationships(entities)
+        rels, _ = infer_relationships(self.entities)
         for rel in rels:
             assert rel.get("inferred") is True
 
@@ -250,11 +288,11 @@ class TestInferRelationships:
 # ---------------------------------------------------------------------------
 
 class TestInferenceIntegration:
-    def test_full_pipeline_no_constraints(self):
+    def test_full_pipeline_no_constraints(self, entities_ro, entities):
         """Simulate a Snowflake pull with zero PK/FK constraints."""
-        entities = _make_entities()
-        # No field has primary_key or foreign_key set
-        for ent in entities:
+        # No field has primary_key or foreign_key set (checked on the frozen
+        # view — reading it cannot dirty the shared template)
+        for ent in entities_ro:
             for f in ent["fields"]:
                 assert "primary_key" not in f
                 assert "foreign_key" not in f
@@ -272,15 +310,55 @@ class TestInferenceIntegration:
 
         # Verify specific relationships exist
         rel_pairs = {(r["from"], r["to"]) for r in rels}
-        assert ("Users.id", "Orders.user_id") in rel_pairs
-        assert ("Orders.id", "OrderItems.order_id") in rel_pairs
+        assert _EXPECTED_RELS.issubset(rel_pairs)
+
+    def test_total_inferred_count(self, entities_with_pks):
+        """Should infer exactly the expected relationships — no more, no less."""
+        rels, _ = infer_relationships(entities_with_pks)
+        # parent_id doesn't match any entity name, so no fifth rel
+        assert {(r["from"], r["to"]) for r in rels} == _EXPECTED_RELS
+
+
+# ---------------------------------------------------------------------------
+# Scaling: inference must stay linear in schema size
+# ---------------------------------------------------------------------------
 
-    def test_total_inferred_count(self):
-        """Should infer exactly the expected number of relationships."""
-        entities = _make_entities()
-        infer_primary_keys(entities)
+def _gen_schema(n):
+    """N chained tables, each referencing the previous, with no constraints."""
+    entities = []
+    for i in range(n):
+        fields = [{"name": "id", "type": "bigint", "nullable": True}]
+        if i:
+            fields.append({"name": f"table{i - 1}_id", "type": "bigint", "nullable": True})
+        entities.append({"name": f"Table{i}", "type": "table", "fields": fields})
+    return entities
+
+
+class TestInferenceScaling:
+    @pytest.mark.parametrize("n", [5, 50, 500])
+    def test_counts_scale_with_schema_size(self, n):
+        entities = _gen_schema(n)
+        _, pk_msgs = infer_primary_keys(entities)
         rels, _ = infer_relationships(entities)
-        # Expected: user_id→Users, order_id→Orders, product_id→Products,
-        #           category_id→Categories, parent_id→? (no match)
-        # parent_id doesn't match any entity name, so no rel
-        assert len(rels) == 4
+        assert len(pk_msgs) == n
+        assert len(rels) == n - 1
+
+    def test_relationship_inference_scales_roughly_linearly(self):
+        def best_cpu_time(n):
+            best = float("inf")
+            for _ in range(5):
+                entities = _gen_schema(n)
+                infer_primary_keys(entities)
+                start = time.process_time()
+                infer_relationships(entities)
+                best = min(best, time.process_time() - start)
+            return best
+
+        t50 = best_cpu_time(50)
+        t500 = best_cpu_time(500)
+        # process_time measures CPU time, so scheduler stalls on shared CI
+        # workers don't distort either sample; the 0.5 ms floor keeps clock
+        # granularity from shrinking the denominator. Linear scaling lands
+        # near 10x here; a quadratic regression (e.g. replacing the entity
+        # lookup dict with a list scan) lands near 100x.
+        assert t500 < max(t50, 0.0005) * 40